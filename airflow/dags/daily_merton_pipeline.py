@@ -11,8 +11,9 @@ Tasks:
 3. Calculate equity volatility
 4. Build Merton inputs
 5. Run Merton solver
-6. Generate trading signals
-7. Send alerts (if configured)
+6. Precompute dashboard signal summary
+7. Generate trading signals
+8. Send alerts (if configured)
 """
 
 from datetime import datetime, timedelta
@@ -170,6 +171,20 @@ def run_merton_model(**context):
     return results
 
 
+def refresh_signal_summary(**context):
+    """Recompute the merton_signals table used by the dashboard."""
+    from src.db.engine import ENGINE
+    from src.db.signals import refresh_signal_summary as refresh_signals
+
+    print("=" * 60)
+    print("REFRESHING SIGNAL SUMMARY")
+    print("=" * 60)
+
+    rows = refresh_signals(ENGINE)
+
+    print(f"[OK] Wrote {rows} signal rows")
+
+
 def generate_trading_signals(**context):
     """Generate CDS trading signals based on DD changes."""
     import pandas as pd
@@ -345,21 +360,28 @@ with DAG(
         provide_context=True,
     )
 
-    # Task 6: Generate signals
+    # Task 6: Precompute DD changes for the dashboard
+    task_refresh_signals = PythonOperator(
+        task_id='refresh_signal_summary',
+        python_callable=refresh_signal_summary,
+        provide_context=True,
+    )
+
+    # Task 7: Generate signals
     task_generate_signals = PythonOperator(
         task_id='generate_signals',
         python_callable=generate_trading_signals,
         provide_context=True,
     )
 
-    # Task 7: Send alerts
+    # Task 8: Send alerts
     task_send_alerts = PythonOperator(
         task_id='send_alerts',
         python_callable=send_alerts,
         provide_context=True,
     )
 
-    # Task 8: Cleanup old data (weekly)
+    # Task 9: Cleanup old data (weekly)
     task_cleanup = PythonOperator(
         task_id='cleanup_old_data',
         python_callable=cleanup_old_data,
@@ -369,5 +391,5 @@ with DAG(
     # Define task dependencies
     task_fetch_equity >> task_update_balance_sheets >> task_calc_volatility
     task_calc_volatility >> task_build_inputs >> task_run_merton
-    task_run_merton >> task_generate_signals >> task_send_alerts
+    task_run_merton >> task_refresh_signals >> task_generate_signals >> task_send_alerts
     task_send_alerts >> task_cleanup
\ No newline at end of file
@@ -264,13 +264,9 @@ def get_batch_pd():
         
         df = pd.read_sql(query, ENGINE)
         
-        # Convert to dict keyed by ticker
-        results = {}
-        for _, row in df.iterrows():
-            ticker = row['ticker']
-            row_dict = row.to_dict()
-            row_dict['date'] = row_dict['date'].isoformat()
-            results[ticker] = row_dict
+        # Convert to dict keyed by ticker (records, not a Series per row)
+        df['date'] = [d.isoformat() for d in df['date']]
+        results = dict(zip(df['ticker'], df.to_dict('records')))
         
         return jsonify({
             'count': len(results),
@@ -358,7 +354,7 @@ def get_trading_signals():
         
         # Generate signals
         signals = []
-        for _, row in df.iterrows():
+        for row in df.to_dict('records'):
             dd_change = row['dd_change']
             
             # Determine action
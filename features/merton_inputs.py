@@ -11,6 +11,11 @@ Combines:
 - T: Time to maturity (default 1 year)
 """
 
+import functools
+import hashlib
+from pathlib import Path
+from typing import Union
+
 import pandas as pd
 import numpy as np
 from sqlalchemy import text
@@ -94,6 +99,142 @@ def build_merton_inputs(
     return complete[final_cols]
 
 
+@functools.lru_cache(maxsize=128)
+def _cached_build_merton_inputs(
+        ticker: str,
+        engine,
+        time_to_maturity: float,
+        volatility_method: str,
+        volatility_window: int,
+        data_stamp: str
+) -> pd.DataFrame:
+    # data_stamp only keys the cache: new source data means a new entry
+    return build_merton_inputs(
+        ticker,
+        engine,
+        time_to_maturity=time_to_maturity,
+        volatility_method=volatility_method,
+        volatility_window=volatility_window
+    )
+
+
+def build_merton_inputs_cached(
+        ticker: str,
+        engine,
+        time_to_maturity: float = 1.0,
+        volatility_method: str = 'rolling',
+        volatility_window: int = 252
+) -> pd.DataFrame:
+    """
+    Memoized build_merton_inputs for repeated analyses of the same ticker.
+
+    The pipeline, sensitivity, bootstrap and stress-test entry points all
+    start from the same inputs, so the SQL + rolling-volatility build is
+    done once per (ticker, engine, settings) and reused. The cache key
+    includes the source data stamp (one small aggregate query per call),
+    so loads and corrections invalidate it without an explicit
+    clear_merton_inputs_cache() in long-lived processes.
+
+    Returns:
+        A copy of the cached inputs, safe for the caller to modify
+    """
+    return _cached_build_merton_inputs(
+        ticker, engine, time_to_maturity, volatility_method, volatility_window,
+        _inputs_data_stamp(ticker, engine)
+    ).copy()
+
+
+def clear_merton_inputs_cache():
+    """Drop all memoized Merton inputs (e.g. to free memory)."""
+    _cached_build_merton_inputs.cache_clear()
+
+
+def _inputs_data_stamp(ticker: str, engine) -> str:
+    """
+    Short fingerprint of the source rows behind a ticker's Merton inputs.
+
+    Per table build_merton_inputs reads: row count and latest date (loads,
+    backfills, deletions), latest write time (ingested_at, or created_at for
+    the delete-and-reinsert debt_daily) and a sum over the value columns
+    read, which also catches in-place corrections that leave the write time
+    alone.
+    """
+    query = text("""
+        SELECT *
+        FROM
+            (SELECT COUNT(*), MAX(trade_date), MAX(ingested_at), SUM(close), SUM(adj_close)
+             FROM equity_prices_raw WHERE ticker = :ticker) AS prices,
+            (SELECT COUNT(*), MAX(date), MAX(created_at), SUM(total_debt)
+             FROM debt_daily WHERE ticker = :ticker) AS debt,
+            (SELECT COUNT(*), MAX(as_of_date), MAX(ingested_at), SUM(shares_outstanding)
+             FROM shares_outstanding WHERE ticker = :ticker) AS shares,
+            (SELECT COUNT(*), MAX(date), MAX(ingested_at), SUM(rate)
+             FROM risk_free_rate) AS rates
+    """)
+    with engine.connect() as conn:
+        row = conn.execute(query, {'ticker': ticker}).fetchone()
+
+    return hashlib.md5(repr(tuple(row)).encode()).hexdigest()[:12]
+
+
+def load_merton_inputs_parquet(
+        ticker: str,
+        engine,
+        cache_dir: Union[str, Path],
+        time_to_maturity: float = 1.0,
+        volatility_method: str = 'rolling',
+        volatility_window: int = 252
+) -> pd.DataFrame:
+    """
+    build_merton_inputs with an on-disk Parquet cache that survives reruns.
+
+    Files are named by ticker, build settings and a fingerprint of the
+    source tables, so a warm rerun is one small SQL query plus a Parquet
+    read instead of the full panel + rolling-volatility build. When the
+    source data changes the ticker's inputs are rebuilt and the old file
+    replaced. Without pyarrow this falls back to building directly.
+
+    Args:
+        ticker: Stock ticker
+        engine: Database engine
+        cache_dir: Directory for the Parquet files (created if missing)
+        time_to_maturity: T parameter (years, default 1.0)
+        volatility_method: 'rolling' or 'ewma'
+        volatility_window: Window for volatility calculation
+
+    Returns:
+        DataFrame with Merton inputs: E, D, σ_E, r, T
+    """
+    settings = dict(
+        time_to_maturity=time_to_maturity,
+        volatility_method=volatility_method,
+        volatility_window=volatility_window
+    )
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("  ⚠️  pyarrow not installed, skipping Parquet input cache")
+        return build_merton_inputs(ticker, engine, **settings)
+
+    cache_dir = Path(cache_dir)
+    prefix = f"{ticker}_T{time_to_maturity:g}_{volatility_method}{volatility_window}"
+    cache_path = cache_dir / f"{prefix}_{_inputs_data_stamp(ticker, engine)}.parquet"
+
+    if cache_path.exists():
+        print(f"\n[LOAD MERTON INPUTS] {ticker} (cached: {cache_path.name})")
+        return pd.read_parquet(cache_path, engine='pyarrow')
+
+    inputs = build_merton_inputs(ticker, engine, **settings)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob(f"{prefix}_*.parquet"):
+        stale.unlink()
+    inputs.to_parquet(cache_path, engine='pyarrow', index=False)
+
+    return inputs
+
+
 def validate_merton_inputs(merton_inputs: pd.DataFrame, ticker: str) -> dict:
     """
     Validate Merton inputs for reasonableness.
@@ -2,7 +2,7 @@ import yfinance as yf
 import pandas as pd
 from datetime import date
 from core.tickers import normalize_ticker
-from db.connection import get_connection
+from db.connection import db_connection
 
 
 
@@ -42,47 +42,47 @@ def fetch_shares_outstanding(ticker: str) -> dict:
 
 
 def save_prices(df: pd.DataFrame):
-    conn = get_connection()
-    cursor = conn.cursor()
+    with db_connection() as conn:
+        cursor = conn.cursor()
+
+        for _, row in df.iterrows():
+            cursor.execute("""
+                INSERT INTO equity_prices_raw
+                (ticker, trade_date, close, adj_close, volume, source)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT (ticker, trade_date) DO NOTHING
+            """, (
+                row["ticker"],
+                row["Date"],
+                row["Close"],
+                row["Adj Close"],
+                row["Volume"],
+                "yahoo"
+            ))
+
+        conn.commit()
+
+
+def save_shares(data: dict):
+    with db_connection() as conn:
+        cursor = conn.cursor()
 
-    for _, row in df.iterrows():
         cursor.execute("""
-            INSERT INTO equity_prices_raw
-            (ticker, trade_date, close, adj_close, volume, source)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            ON CONFLICT (ticker, trade_date) DO NOTHING
+            INSERT INTO shares_outstanding
+            (ticker, shares_outstanding, source, as_of)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (ticker) DO UPDATE
+            SET shares_outstanding = EXCLUDED.shares_outstanding,
+                as_of = EXCLUDED.as_of,
+                ingested_at = NOW()
         """, (
-            row["ticker"],
-            row["Date"],
-            row["Close"],
-            row["Adj Close"],
-            row["Volume"],
-            "yahoo"
+            data["ticker"],
+            data["shares_outstanding"],
+            data["source"],
+            data["as_of"]
         ))
 
-    conn.commit()
-
-
-def save_shares(data: dict):
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        INSERT INTO shares_outstanding
-        (ticker, shares_outstanding, source, as_of)
-        VALUES (%s, %s, %s, %s)
-        ON CONFLICT (ticker) DO UPDATE
-        SET shares_outstanding = EXCLUDED.shares_outstanding,
-            as_of = EXCLUDED.as_of,
-            ingested_at = NOW()
-    """, (
-        data["ticker"],
-        data["shares_outstanding"],
-        data["source"],
-        data["as_of"]
-    ))
-
-    conn.commit()
+        conn.commit()
 
 
 def run(tickers: list[str]):
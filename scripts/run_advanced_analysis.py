@@ -12,6 +12,10 @@ Usage:
     python scripts/run_advanced_analysis.py AAPL --bootstrap
     python scripts/run_advanced_analysis.py AAPL --sensitivity
     python scripts/run_advanced_analysis.py AAPL --stress
+    python scripts/run_advanced_analysis.py AAPL --all --csv
+
+Results are written to results/ as Arrow IPC (.feather) files; pass --csv
+to also write CSV copies.
 """
 
 import sys
@@ -22,55 +26,84 @@ import argparse
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-import pandas as pd
-import numpy as np
-
+# Heavy imports (pandas, scipy, SQLAlchemy, the merton package) are
+# deferred to the helpers that need them so `--help` stays fast
 try:
-    from src.db.engine import ENGINE
-    from src.merton.bootstrap import run_bootstrap_analysis
-    from src.merton.sensitivity import run_sensitivity_analysis
-    from src.merton.stress_testing import run_stress_test
     from src.utils.logger import setup_logger
 except ImportError:
-    from db.engine import ENGINE
-    from merton.bootstrap import run_bootstrap_analysis
-    from merton.sensitivity import run_sensitivity_analysis
-    from merton.stress_testing import run_stress_test
     from utils.logger import setup_logger
 
-logger = setup_logger('advanced_analysis', log_file='logs/advanced_analysis.log')
+logger = setup_logger('advanced_analysis', log_file='logs/advanced_analysis.log', use_queue=True)
+
+# Output directory is created once here rather than in every helper
+Path("results").mkdir(exist_ok=True)
+
+
+def save_results(df, name: str, csv: bool = False) -> str:
+    """
+    Save a results DataFrame under results/.
+
+    Writes Arrow IPC (.feather, lz4) so downstream readers can load it with
+    pyarrow.feather.read_table without re-parsing text. Falls back to CSV
+    if pyarrow is not installed.
+
+    Args:
+        df: Results DataFrame
+        name: File stem (e.g. 'stress_test_AAPL')
+        csv: Also write a CSV copy
+
+    Returns:
+        Path of the primary output file
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+    except ImportError:
+        logger.warning("pyarrow not installed, writing CSV only")
+        csv = True
+        output_file = f"results/{name}.csv"
+    else:
+        output_file = f"results/{name}.feather"
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        feather.write_feather(table, output_file, compression='lz4')
+
+    if csv:
+        df.to_csv(f"results/{name}.csv", index=False)
 
-pd.set_option('display.max_columns', None)
-pd.set_option('display.width', None)
-pd.set_option('display.precision', 4)
+    return output_file
 
 
-def run_bootstrap(ticker: str, n_iterations: int = 1000):
+def run_bootstrap(ticker: str, n_iterations: int = 1000, csv: bool = False):
     """Run bootstrap uncertainty analysis."""
-    logger.info(f"\n{'=' * 60}")
-    logger.info(f"BOOTSTRAP UNCERTAINTY ANALYSIS: {ticker}")
-    logger.info(f"{'=' * 60}")
-    logger.info(f"Running {n_iterations} bootstrap iterations...")
+    logger.info(
+        f"\n{'=' * 60}\n"
+        f"BOOTSTRAP UNCERTAINTY ANALYSIS: {ticker}\n"
+        f"{'=' * 60}\n"
+        f"Running {n_iterations} bootstrap iterations..."
+    )
 
     try:
-        results = run_bootstrap_analysis(ticker, ENGINE, n_iterations=n_iterations)
+        from src.db.engine import get_engine
+        from src.merton.bootstrap import run_bootstrap_analysis
+
+        results = run_bootstrap_analysis(ticker, get_engine(), n_iterations=n_iterations)
 
         # Show summary for most recent date
         recent = results.iloc[-1]
 
-        logger.info(f"\nMost Recent Date: {recent['date']}")
-        logger.info(f"Convergence Rate: {recent['convergence_rate']:.1%}")
-        logger.info(f"\nProbability of Default:")
-        logger.info(f"  Median:  {recent['PD_median']:.4%}")
-        logger.info(f"  95% CI:  [{recent['PD_lower']:.4%}, {recent['PD_upper']:.4%}]")
-        logger.info(f"\nDistance to Default:")
-        logger.info(f"  Median:  {recent['DD_median']:.2f}")
-        logger.info(f"  95% CI:  [{recent['DD_lower']:.2f}, {recent['DD_upper']:.2f}]")
+        logger.info(
+            f"\nMost Recent Date: {recent['date']}\n"
+            f"Convergence Rate: {recent['convergence_rate']:.1%}\n"
+            f"\nProbability of Default:\n"
+            f"  Median:  {recent['PD_median']:.4%}\n"
+            f"  95% CI:  [{recent['PD_lower']:.4%}, {recent['PD_upper']:.4%}]\n"
+            f"\nDistance to Default:\n"
+            f"  Median:  {recent['DD_median']:.2f}\n"
+            f"  95% CI:  [{recent['DD_lower']:.2f}, {recent['DD_upper']:.2f}]"
+        )
 
         # Save results
-        output_file = f"results/bootstrap_{ticker}.csv"
-        Path("results").mkdir(exist_ok=True)
-        results.to_csv(output_file, index=False)
+        output_file = save_results(results, f"bootstrap_{ticker}", csv=csv)
         logger.info(f"\n[OK] Results saved to {output_file}")
 
         return results
@@ -82,30 +115,33 @@ def run_bootstrap(ticker: str, n_iterations: int = 1000):
         return None
 
 
-def run_sensitivity(ticker: str):
+def run_sensitivity(ticker: str, csv: bool = False):
     """Run sensitivity analysis."""
-    logger.info(f"\n{'=' * 60}")
-    logger.info(f"SENSITIVITY ANALYSIS: {ticker}")
-    logger.info(f"{'=' * 60}")
+    logger.info(
+        f"\n{'=' * 60}\n"
+        f"SENSITIVITY ANALYSIS: {ticker}\n"
+        f"{'=' * 60}"
+    )
 
     try:
-        results = run_sensitivity_analysis(ticker, ENGINE)
+        from src.db.engine import get_engine
+        from src.merton.sensitivity import run_sensitivity_analysis
 
-        # Display volatility sensitivity
-        logger.info(f"\nVolatility Sensitivity:")
-        vol_df = results['volatility']
-        logger.info(f"\n{vol_df[['sigma_E', 'DD', 'PD']].head(10).to_string()}")
+        results = run_sensitivity_analysis(ticker, get_engine())
 
-        # Display debt sensitivity
-        logger.info(f"\nDebt Sensitivity (+/- 50%):")
+        # Display volatility and debt sensitivity
+        vol_df = results['volatility']
         debt_df = results['debt']
-        logger.info(f"\n{debt_df[['debt_change_pct', 'D', 'DD', 'PD']].to_string()}")
+        logger.info(
+            f"\nVolatility Sensitivity:\n"
+            f"\n{vol_df[['sigma_E', 'DD', 'PD']].head(10).to_string()}\n"
+            f"\nDebt Sensitivity (+/- 50%):\n"
+            f"\n{debt_df[['debt_change_pct', 'D', 'DD', 'PD']].to_string()}"
+        )
 
         # Save results
-        Path("results").mkdir(exist_ok=True)
         for name, df in results.items():
-            output_file = f"results/sensitivity_{ticker}_{name}.csv"
-            df.to_csv(output_file, index=False)
+            output_file = save_results(df, f"sensitivity_{ticker}_{name}", csv=csv)
             logger.info(f"[OK] {name.title()} sensitivity saved to {output_file}")
 
         return results
@@ -117,33 +153,43 @@ def run_sensitivity(ticker: str):
         return None
 
 
-def run_stress_tests(ticker: str):
+def run_stress_tests(ticker: str, csv: bool = False):
     """Run stress testing."""
-    logger.info(f"\n{'=' * 60}")
-    logger.info(f"STRESS TESTING: {ticker}")
-    logger.info(f"{'=' * 60}")
+    logger.info(
+        f"\n{'=' * 60}\n"
+        f"STRESS TESTING: {ticker}\n"
+        f"{'=' * 60}"
+    )
 
     try:
-        results = run_stress_test(ticker, ENGINE)
+        from src.db.engine import get_engine
+        from src.merton.stress_testing import run_stress_test
 
-        # Display results
-        logger.info(f"\nStress Test Results:")
-        display_cols = ['scenario_name', 'base_PD', 'stressed_PD', 'PD_change_pct']
-        logger.info(f"\n{results[display_cols].to_string()}")
+        results = run_stress_test(ticker, get_engine())
 
-        # Detailed breakdown
-        logger.info(f"\nDetailed Results:")
-        for _, row in results.iterrows():
-            logger.info(f"\n{row['scenario_name']}:")
-            logger.info(f"  {row['scenario_description']}")
-            logger.info(f"  Base DD:      {row['base_DD']:.2f}")
-            logger.info(f"  Stressed DD:  {row['stressed_DD']:.2f}")
-            logger.info(f"  Change:       {row['DD_change']:.2f} ({row['PD_change_pct']:.1f}%)")
+        # Display results with a detailed per-scenario breakdown
+        display_cols = ['scenario_name', 'base_PD', 'stressed_PD', 'PD_change_pct']
+        details = "".join(
+            f"\n{name}:\n"
+            f"  {description}\n"
+            f"  Base DD:      {base_dd:.2f}\n"
+            f"  Stressed DD:  {stressed_dd:.2f}\n"
+            f"  Change:       {dd_change:.2f} ({pd_change_pct:.1f}%)\n"
+            for name, description, base_dd, stressed_dd, dd_change, pd_change_pct in zip(
+                results['scenario_name'], results['scenario_description'],
+                results['base_DD'], results['stressed_DD'],
+                results['DD_change'], results['PD_change_pct']
+            )
+        )
+        logger.info(
+            f"\nStress Test Results:\n"
+            f"\n{results[display_cols].to_string()}\n"
+            f"\nDetailed Results:\n"
+            f"{details}"
+        )
 
         # Save results
-        output_file = f"results/stress_test_{ticker}.csv"
-        Path("results").mkdir(exist_ok=True)
-        results.to_csv(output_file, index=False)
+        output_file = save_results(results, f"stress_test_{ticker}", csv=csv)
         logger.info(f"\n[OK] Results saved to {output_file}")
 
         return results
@@ -164,29 +210,40 @@ def main():
     parser.add_argument('--sensitivity', action='store_true', help='Run sensitivity analysis')
     parser.add_argument('--stress', action='store_true', help='Run stress tests')
     parser.add_argument('--iterations', type=int, default=1000, help='Bootstrap iterations (default: 1000)')
+    parser.add_argument('--csv', action='store_true', help='Also write CSV copies of the results')
 
     args = parser.parse_args()
 
+    import pandas as pd
+
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.width', None)
+    pd.set_option('display.precision', 4)
+
     ticker = args.ticker.upper()
 
-    logger.info(f"\n{'#' * 60}")
-    logger.info(f"# ADVANCED MERTON ANALYSIS: {ticker}")
-    logger.info(f"{'#' * 60}")
+    logger.info(
+        f"\n{'#' * 60}\n"
+        f"# ADVANCED MERTON ANALYSIS: {ticker}\n"
+        f"{'#' * 60}"
+    )
 
     # Run selected analyses
     if args.all or args.bootstrap:
-        run_bootstrap(ticker, n_iterations=args.iterations)
+        run_bootstrap(ticker, n_iterations=args.iterations, csv=args.csv)
 
     if args.all or args.sensitivity:
-        run_sensitivity(ticker)
+        run_sensitivity(ticker, csv=args.csv)
 
     if args.all or args.stress:
-        run_stress_tests(ticker)
-
-    logger.info(f"\n{'#' * 60}")
-    logger.info(f"# ANALYSIS COMPLETE")
-    logger.info(f"{'#' * 60}")
-    logger.info(f"\nResults saved to results/ directory")
+        run_stress_tests(ticker, csv=args.csv)
+
+    logger.info(
+        f"\n{'#' * 60}\n"
+        f"# ANALYSIS COMPLETE\n"
+        f"{'#' * 60}\n"
+        f"\nResults saved to results/ directory"
+    )
 
 
 if __name__ == "__main__":
@@ -9,8 +9,6 @@ Usage:
 """
 
 import sys
-from src.db.engine import ENGINE
-from src.merton.pipeline import MertonPipeline
 from src.utils.logger import setup_logger
 
 # Setup logging
@@ -34,9 +32,13 @@ def run_merton_model(tickers: list, store_results: bool = True):
     logger.info(f"Tickers: {', '.join(tickers)}")
     logger.info(f"Store results: {store_results}")
 
+    # Deferred so importing this module doesn't pull in pandas/SQLAlchemy
+    from src.db.engine import get_engine
+    from src.merton.pipeline import MertonPipeline
+
     # Initialize pipeline
     pipeline = MertonPipeline(
-        engine=ENGINE,
+        engine=get_engine(),
         use_real_world=False,  # Use risk-neutral by default
         mu_default=0.02  # 2% default asset drift
     )
@@ -66,8 +68,11 @@ def run_merton_model(tickers: list, store_results: bool = True):
             logger.info(f"   Converged: {converged}/{total}")
             logger.info(f"   Mean PD: {mean_pd:.2%}")
 
-            # Show recent PDs
-            recent = df.nlargest(3, 'date')[['date', 'DD', 'PD']]
+            # Show recent PDs (pipeline output is date-ascending, so the
+            # last rows are the most recent; sort only if that ever breaks)
+            if not df['date'].is_monotonic_increasing:
+                df = df.sort_values('date', kind='stable')
+            recent = df.tail(3).iloc[::-1][['date', 'DD', 'PD']]
             logger.info(f"   Recent PDs:")
             for _, row in recent.iterrows():
                 logger.info(f"     {row['date']}: DD={row['DD']:.2f}, PD={row['PD']:.2%}")
@@ -5,6 +5,7 @@ Tests all system components are working correctly.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent
@@ -28,34 +29,48 @@ except Exception as e:
     print(f"Database: {e}")
     sys.exit(1)
 
-# Test 2: API
+# Tests 2-4: HTTP services. The probes are independent, so they run
+# concurrently over one keep-alive session; results print in fixed order.
+endpoints = {
+    'API': 'http://localhost:5000/api/health',
+    'Streamlit': 'http://localhost:8501',
+    'Airflow': 'http://localhost:8080/health',
+}
+
+session = requests.Session()
+with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+    futures = {
+        name: executor.submit(session.get, url, timeout=5)
+        for name, url in endpoints.items()
+    }
+
 print("\n[2/4] Testing REST API...")
 try:
-    r = requests.get('http://localhost:5000/api/health', timeout=5)
+    r = futures['API'].result()
     status = r.json().get('status', 'unknown')
     print(f"API: {status}")
 except Exception as e:
     print(f"API: {e}")
     print("    (Make sure API is running: python api/merton_api.py)")
 
-# Test 3: Streamlit
 print("\n[3/4] Testing Streamlit...")
 try:
-    r = requests.get('http://localhost:8501', timeout=5)
+    r = futures['Streamlit'].result()
     print(f"Streamlit: Running (status {r.status_code})")
 except Exception as e:
     print(f"Streamlit: {e}")
     print("    (Make sure Streamlit is running: streamlit run streamlit_app/dashboard.py)")
 
-# Test 4: Airflow
 print("\n[4/4] Testing Airflow...")
 try:
-    r = requests.get('http://localhost:8080/health', timeout=5)
+    r = futures['Airflow'].result()
     print(f"Airflow: Running")
 except Exception as e:
     print(f"Airflow: {e}")
     print("    (Make sure Airflow is running: airflow webserver)")
 
+session.close()
+
 print("\n" + "=" * 60)
 print("VERIFICATION COMPLETE")
 print("=" * 60)
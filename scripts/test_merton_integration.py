@@ -6,6 +6,9 @@ Comprehensive test suite for Merton model integration.
 Tests:
 1. Solver with known inputs (from your Colab example)
 2. DD/PD calculations
+2b. ndtr-based PD matches norm.cdf
+2c. Batched solver matches the scalar solver
+2d. Analytic Jacobian matches finite differences
 3. DataFrame processing
 4. Database storage and retrieval
 5. End-to-end pipeline
@@ -14,7 +17,9 @@ Tests:
 import numpy as np
 import pandas as pd
 from src.db.engine import ENGINE
-from src.merton.solver import MertonSolver, solve_merton_single
+from src.merton.solver import (
+    MertonSolver, solve_merton_single, _kernel_args, _merton_residuals, _merton_jacobian
+)
 from src.merton.distance_to_default import (
     calculate_dd_risk_neutral,
     calculate_pd_from_dd
@@ -99,6 +104,103 @@ def test_dd_pd_calculations(V, sigma_V, D, r, T):
     return DD, PD
 
 
+def test_pd_ndtr_equivalence():
+    """Test that the ndtr-based PD matches scipy.stats.norm.cdf."""
+    print("\n" + "=" * 60)
+    print("TEST 2b: PD via ndtr vs norm.cdf")
+    print("=" * 60)
+
+    from scipy.stats import norm
+
+    DD_values = np.linspace(-10.0, 40.0, 501)
+    pd_ndtr = np.array([calculate_pd_from_dd(dd) for dd in DD_values])
+    pd_norm = norm.cdf(-DD_values)
+
+    max_abs_diff = float(np.max(np.abs(pd_ndtr - pd_norm)))
+    print(f"Max |ndtr - norm.cdf|: {max_abs_diff:.3e}")
+
+    # Validation
+    assert max_abs_diff <= 1e-15, "ndtr PD should match norm.cdf to 1e-15"
+    assert np.isnan(calculate_pd_from_dd(np.nan)), "NaN DD should give NaN PD"
+
+    print("\n✅ TEST PASSED")
+
+
+def test_solve_batch_matches_scalar():
+    """Test that the vectorized Newton solver agrees with scalar fsolve."""
+    print("\n" + "=" * 60)
+    print("TEST 2c: Batched Solver vs Scalar Solver")
+    print("=" * 60)
+
+    rng = np.random.default_rng(0)
+    n = 500
+    E = rng.uniform(1e9, 3e11, n)
+    sigma_E = rng.uniform(0.1, 2.5, n)
+    D = E * rng.uniform(0.01, 2.0, n)
+    r = rng.uniform(0.0, 0.08, n)
+    T = rng.choice([0.5, 1.0, 5.0], n)
+
+    solver = MertonSolver()
+    batch = solver.solve_batch(E, sigma_E, D, r, T)
+    scalar = [solver.solve(*args) for args in zip(E, sigma_E, D, r, T)]
+
+    scalar_ok = np.array([res['converged'] for res in scalar])
+    scalar_V = np.array([res['V'] for res in scalar])
+    both = batch['converged'] & scalar_ok
+
+    max_rel_V = float(np.max(np.abs(batch['V'][both] / scalar_V[both] - 1)))
+    print(f"Converged: batch {batch['converged'].sum()}/{n}, scalar {scalar_ok.sum()}/{n}")
+    print(f"Max relative V difference: {max_rel_V:.3e}")
+
+    # Validation
+    assert not (scalar_ok & ~batch['converged']).any(), "Batch should converge wherever fsolve does"
+    assert max_rel_V <= 1e-8, "Batch V should match fsolve"
+
+    print("\n✅ TEST PASSED")
+
+
+def test_analytic_jacobian():
+    """Test the closed-form Jacobian against central finite differences."""
+    print("\n" + "=" * 60)
+    print("TEST 2d: Analytic Jacobian vs Finite Differences")
+    print("=" * 60)
+
+    rng = np.random.default_rng(0)
+    worst = 0.0
+
+    for _ in range(200):
+        E = rng.uniform(1e9, 1e11)
+        sigma_E = rng.uniform(0.1, 1.0)
+        D = rng.uniform(1e8, 1e11)
+        r = rng.uniform(0.0, 0.08)
+        T = rng.uniform(0.5, 3.0)
+        V = D + E * rng.uniform(0.5, 1.5)
+        sigma_V = rng.uniform(0.05, 0.8)
+        args = _kernel_args(E, sigma_E, D, r, T)
+
+        J = np.array(_merton_jacobian(V, sigma_V, *args))
+        h_V, h_s = V * 1e-5, sigma_V * 1e-5
+        fd = np.column_stack([
+            (np.array(_merton_residuals(V + h_V, sigma_V, *args))
+             - np.array(_merton_residuals(V - h_V, sigma_V, *args))) / (2 * h_V),
+            (np.array(_merton_residuals(V, sigma_V + h_s, *args))
+             - np.array(_merton_residuals(V, sigma_V - h_s, *args))) / (2 * h_s),
+        ])
+
+        # Finite differences can't resolve below the residuals' rounding
+        # noise (eq1 is O(V), eq2 is O(1)), so allow for it per element
+        noise = 256 * np.finfo(float).eps * np.outer([V, 1.0], [1 / h_V, 1 / h_s])
+        excess = np.maximum(np.abs(fd - J) - noise, 0.0)
+        worst = max(worst, float(np.max(excess / np.maximum(np.abs(J), np.finfo(float).tiny))))
+
+    print(f"Max relative Jacobian error (beyond FD noise): {worst:.3e}")
+
+    # Validation
+    assert worst < 1e-5, "Analytic Jacobian should match finite differences"
+
+    print("\n✅ TEST PASSED")
+
+
 def test_dataframe_processing():
     """Test solver on DataFrame."""
     print("\n" + "=" * 60)
@@ -153,7 +255,7 @@ def test_database_storage():
         'equity_to_asset_ratio': [0.987],
         'iterations': [10],
         'converged': [True],
-        'solver_method': ['kmv_fsolve']
+        'solver_method': ['kmv_newton']
     })
 
     # Convert date to date object
@@ -265,6 +367,15 @@ def run_all_tests():
             T=1.0
         )
 
+        # Test 2b: ndtr equivalence
+        test_pd_ndtr_equivalence()
+
+        # Test 2c: Batched solver
+        test_solve_batch_matches_scalar()
+
+        # Test 2d: Analytic Jacobian
+        test_analytic_jacobian()
+
         # Test 3: DataFrame
         test_dataframe_processing()
 
@@ -1,5 +1,37 @@
-import psycopg2
+import threading
+from contextlib import contextmanager
+
+from psycopg2.pool import ThreadedConnectionPool
 from core.config import DB_CONFIG
 
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
 def get_connection():
-    return psycopg2.connect(**DB_CONFIG)
+    """Borrow a connection from the shared pool (created on first use)."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ThreadedConnectionPool(1, 16, **DB_CONFIG)
+    return _POOL.getconn()
+
+
+def release_connection(conn):
+    """Return a connection obtained from get_connection() to the pool."""
+    _POOL.putconn(conn)
+
+
+@contextmanager
+def db_connection():
+    """Borrow a pooled connection and give it back afterwards."""
+    conn = get_connection()
+    try:
+        yield conn
+    except Exception:
+        # Don't hand an aborted transaction to the next borrower
+        conn.rollback()
+        raise
+    finally:
+        release_connection(conn)
@@ -141,3 +141,64 @@ ON risk_free_rate(date DESC);
 
 COMMENT ON TABLE risk_free_rate IS
 'Daily risk-free rate (1-Year Treasury). Forward-filled for missing days.';
+
+-- ----------------------------
+-- LAYER 4: MODEL OUTPUTS
+-- ----------------------------
+
+-- Merton model outputs (one row per ticker per day)
+CREATE TABLE IF NOT EXISTS merton_outputs (
+    ticker TEXT NOT NULL,
+    date DATE NOT NULL,
+    asset_value DOUBLE PRECISION,
+    asset_volatility DOUBLE PRECISION,
+    distance_to_default DOUBLE PRECISION,
+    probability_default DOUBLE PRECISION,
+    d1 DOUBLE PRECISION,
+    d2 DOUBLE PRECISION,
+    converged BOOLEAN,
+    iterations INTEGER,
+    solver_method TEXT,
+    leverage_ratio DOUBLE PRECISION,
+    equity_to_asset_ratio DOUBLE PRECISION,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+-- created_at is the row's last write time: the pipeline's upsert resets it
+-- on conflict, so MAX(created_at) moves whenever outputs change.
+-- Tables created earlier by pandas.to_sql have no created_at
+ALTER TABLE merton_outputs
+ADD COLUMN IF NOT EXISTS created_at TIMESTAMP NOT NULL DEFAULT NOW();
+
+-- Upsert key for MertonPipeline._store_results (ON CONFLICT (ticker, date)).
+-- A unique index rather than a PRIMARY KEY so it also applies to tables
+-- created earlier by pandas.to_sql
+CREATE UNIQUE INDEX IF NOT EXISTS idx_merton_outputs_ticker_date
+ON merton_outputs(ticker, date);
+
+-- Latest-row-per-ticker lookups (ORDER BY ticker, date DESC) in the dashboard
+CREATE INDEX IF NOT EXISTS idx_merton_outputs_ticker_date_desc
+ON merton_outputs(ticker, date DESC);
+
+-- Latest output per ticker for the dashboard. Refreshed by MertonPipeline
+-- after it stores results (CONCURRENTLY needs the unique index below)
+CREATE MATERIALIZED VIEW IF NOT EXISTS merton_latest AS
+SELECT DISTINCT ON (ticker) *
+FROM merton_outputs
+ORDER BY ticker, date DESC;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_merton_latest_ticker
+ON merton_latest(ticker);
+
+-- DD change per ticker over standard lookback windows, for trading signals.
+-- Rebuilt after each daily run by src/db/signals.refresh_signal_summary
+CREATE TABLE IF NOT EXISTS merton_signals (
+    ticker TEXT NOT NULL,
+    lookback_days INTEGER NOT NULL,
+    current_dd DOUBLE PRECISION,
+    historical_dd DOUBLE PRECISION,
+    dd_change DOUBLE PRECISION,
+    computed_at TIMESTAMP NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (lookback_days, ticker)
+);
@@ -0,0 +1,60 @@
+# db/signals.py
+"""
+Precomputed CDS trading-signal inputs (merton_signals table).
+
+DD changes against each standard lookback window are computed once after
+the daily pipeline run, so the dashboard reads them with an indexed lookup
+instead of joining merton_outputs against itself on every request.
+"""
+
+from sqlalchemy import text
+
+# Lookback windows (days) kept in merton_signals
+SIGNAL_LOOKBACK_DAYS = (7, 14, 30, 60, 90)
+
+
+def refresh_signal_summary(engine, lookback_days=SIGNAL_LOOKBACK_DAYS) -> int:
+    """
+    Rebuild merton_signals from merton_outputs in a single windowed pass.
+
+    Each ticker's history is walked newest-first once: FIRST_VALUE gives the
+    current DD and LAG the next newer date, so the row that is the latest on
+    or before CURRENT_DATE - lookback is the one whose newer neighbour falls
+    after that cutoff. Tickers without history that far back get no row for
+    that window.
+
+    Args:
+        engine: SQLAlchemy engine (Postgres)
+        lookback_days: Lookback windows to compute
+
+    Returns:
+        Number of rows written
+    """
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM merton_signals"))
+        result = conn.execute(text("""
+            INSERT INTO merton_signals
+                (ticker, lookback_days, current_dd, historical_dd, dd_change)
+            SELECT
+                h.ticker,
+                lb.lookback_days,
+                h.current_dd,
+                h.distance_to_default,
+                h.current_dd - h.distance_to_default
+            FROM (
+                SELECT
+                    ticker,
+                    date,
+                    distance_to_default,
+                    FIRST_VALUE(distance_to_default) OVER w AS current_dd,
+                    LAG(date) OVER w AS newer_date
+                FROM merton_outputs
+                WINDOW w AS (PARTITION BY ticker ORDER BY date DESC)
+            ) h
+            JOIN unnest(CAST(:lookback_days AS INTEGER[])) AS lb(lookback_days)
+                ON h.date <= CURRENT_DATE - lb.lookback_days * INTERVAL '1 day'
+                AND (h.newer_date IS NULL
+                     OR h.newer_date > CURRENT_DATE - lb.lookback_days * INTERVAL '1 day')
+        """), {"lookback_days": list(lookback_days)})
+
+    return result.rowcount
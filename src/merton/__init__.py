@@ -13,6 +13,8 @@ This module provides:
 - PD calibration
 """
 
+import importlib
+
 from .solver import MertonSolver, solve_merton_single
 from .distance_to_default import (
     calculate_dd_risk_neutral,
@@ -24,14 +26,39 @@ from .distance_to_default import (
     shrink_mu,
     add_dd_pd_to_dataframe
 )
-from .pipeline import MertonPipeline, run_merton_pipeline
-from .bootstrap import BootstrapUncertainty, run_bootstrap_analysis
-from .sensitivity import SensitivityAnalyzer, run_sensitivity_analysis
-from .stress_testing import StressTester, StressScenario, run_stress_test
-from .calibration import PDCalibrator, train_calibration_model
 
 __version__ = '1.0.0'
 
+# Heavier submodules are imported on first attribute access (PEP 562), so
+# `from merton import calculate_pd_from_dd` does not pull in the pipeline,
+# database or analysis code
+_LAZY_ATTRS = {
+    'MertonPipeline': '.pipeline',
+    'run_merton_pipeline': '.pipeline',
+    'BootstrapUncertainty': '.bootstrap',
+    'run_bootstrap_analysis': '.bootstrap',
+    'SensitivityAnalyzer': '.sensitivity',
+    'run_sensitivity_analysis': '.sensitivity',
+    'StressTester': '.stress_testing',
+    'StressScenario': '.stress_testing',
+    'run_stress_test': '.stress_testing',
+    'PDCalibrator': '.calibration',
+    'train_calibration_model': '.calibration',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so __getattr__ isn't hit again
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 __all__ = [
     # Solver
     'MertonSolver',
@@ -9,10 +9,18 @@ Estimates confidence intervals for V, σ_V, DD, and PD by:
 3. Computing percentiles to get confidence intervals
 """
 
+import multiprocessing as mp
+import os
+
 import numpy as np
 import pandas as pd
-from typing import Dict, Tuple, Optional
-from scipy.stats import norm
+from typing import Dict, List, Tuple, Optional
+from scipy.special import ndtr, ndtri
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
 
 try:
     from src.merton.solver import MertonSolver
@@ -27,6 +35,9 @@ except ImportError:
         calculate_pd_from_dd
     )
 
+# Total draws (rows x n_iterations) above which device='cuda' is used
+GPU_MIN_WORK = 1_000_000
+
 
 class BootstrapUncertainty:
     """
@@ -37,7 +48,8 @@ class BootstrapUncertainty:
             self,
             n_iterations: int = 2000,
             confidence_level: float = 0.95,
-            random_seed: Optional[int] = None
+            random_seed: Optional[int] = None,
+            device: str = 'cpu'
     ):
         """
         Initialize bootstrap analyzer.
@@ -46,12 +58,14 @@ class BootstrapUncertainty:
             n_iterations: Number of bootstrap iterations
             confidence_level: Confidence level (e.g., 0.95 for 95% CI)
             random_seed: Random seed for reproducibility
+            device: 'cpu', or 'cuda' to solve large DataFrame runs on the
+                GPU with CuPy (see run_bootstrap_dataframe)
         """
         self.n_iterations = n_iterations
         self.confidence_level = confidence_level
-
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        self.random_seed = random_seed
+        self.device = device
+        self.rng = np.random.default_rng(random_seed)
 
         # Calculate percentiles for confidence intervals
         alpha = 1 - confidence_level
@@ -68,7 +82,8 @@ class BootstrapUncertainty:
             mu: float,
             se_sigma_E: Optional[float] = None,
             se_mu: Optional[float] = None,
-            pct_noise_D: float = 0.03
+            pct_noise_D: float = 0.03,
+            keep_samples: bool = False
     ) -> Dict:
         """
         Run bootstrap simulation for single observation.
@@ -83,127 +98,110 @@ class BootstrapUncertainty:
             se_sigma_E: Standard error of equity volatility (default: 10% of σ_E)
             se_mu: Standard error of mu (default: 50% of μ)
             pct_noise_D: Percentage noise for debt (default: 3%)
+            keep_samples: Include the raw sample arrays (e.g. for plotting)
 
         Returns:
             Dictionary with bootstrap results and confidence intervals
         """
-        # Set default standard errors if not provided
-        if se_sigma_E is None:
-            se_sigma_E = sigma_E * 0.1  # 10% of equity volatility
-
-        if se_mu is None:
-            se_mu = abs(mu) * 0.5 if mu != 0 else 0.01  # 50% of mu
+        sigma_E_draws, D_draws, mu_draws = self._draw_inputs(
+            sigma_E, D, mu, se_sigma_E, se_mu, pct_noise_D
+        )
 
-        # Storage for bootstrap samples
-        V_samples = []
-        sigma_V_samples = []
-        DD_samples = []
-        PD_samples = []
+        # Solve every draw in one vectorized pass
+        solved = MertonSolver().solve_batch(E, sigma_E_draws, D_draws, r, T)
 
-        solver = MertonSolver()
-
-        for _ in range(self.n_iterations):
-            # Draw noisy inputs
-            E_b = E  # Typically hold equity fixed
-            sigma_E_b = self._draw_positive_normal(sigma_E, se_sigma_E)
-            D_b = D * np.exp(np.random.normal(0, pct_noise_D))  # Lognormal noise
-            mu_b = np.random.normal(mu, se_mu)
-
-            # Solve Merton model
-            result = solver.solve(E_b, sigma_E_b, D_b, r, T)
-
-            if not result['converged']:
-                continue  # Skip non-converged samples
-
-            V_b = result['V']
-            sigma_V_b = result['sigma_V']
-
-            # Calculate DD and PD (real-world)
-            DD_b = calculate_dd_real_world(V_b, D_b, sigma_V_b, mu_b, T)
-            PD_b = calculate_pd_from_dd(DD_b)
-
-            # Store samples
-            V_samples.append(V_b)
-            sigma_V_samples.append(sigma_V_b)
-            DD_samples.append(DD_b)
-            PD_samples.append(PD_b)
-
-        # Calculate statistics
-        results = {
-            'n_samples': len(V_samples),
-            'convergence_rate': len(V_samples) / self.n_iterations,
-            'V': self._compute_stats(V_samples),
-            'sigma_V': self._compute_stats(sigma_V_samples),
-            'DD': self._compute_stats(DD_samples),
-            'PD': self._compute_stats(PD_samples)
-        }
-
-        return results
+        return self._summarize(solved, D_draws, mu_draws, T, keep_samples)
 
     def run_bootstrap_dataframe(
             self,
             df: pd.DataFrame,
             se_sigma_E: Optional[float] = None,
             se_mu: Optional[float] = None,
-            show_progress: bool = True
+            show_progress: bool = True,
+            n_jobs: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Run bootstrap for entire DataFrame.
 
+        Rows are independent, so they are farmed out to a process pool.
+        Each row gets its own seed spawned from random_seed, which keeps
+        results reproducible regardless of n_jobs.
+
         Args:
             df: DataFrame with columns: E, sigma_E, D, r, T, mu
             se_sigma_E: Standard error of equity volatility
             se_mu: Standard error of mu
             show_progress: Show progress bar
+            n_jobs: Worker processes (default: os.cpu_count(); 1 = serial)
+
+        With device='cuda' and more than GPU_MIN_WORK total draws, the pool is
+        skipped and all rows are solved in a single batch on the GPU; the
+        per-row seeds are the same, so results match the CPU path.
 
         Returns:
             DataFrame with bootstrap confidence intervals
         """
-        results = []
-
-        # Limit to recent data for speed (bootstrap is slow for 291 rows)
-        print(f"Original data: {len(df)} rows")
-        if len(df) > 10:
-            print(f"Using last 10 rows for bootstrap (full dataset too slow)")
-            df = df.tail(10)
-
         total_rows = len(df)
 
-        for idx, row in df.iterrows():
+        # Pull the inputs out as plain float arrays once (SoA) so each task
+        # carries scalars rather than a boxed row
+        E_arr, sigma_E_arr, D_arr, r_arr, T_arr = (
+            df[col].to_numpy(dtype=np.float64)
+            for col in ('E', 'sigma_E', 'D', 'r', 'T')
+        )
+        if 'mu' in df.columns:
+            mu_arr = df['mu'].to_numpy(dtype=np.float64)
+        else:
+            mu_arr = np.full(total_rows, 0.02)  # Default mu if not present
+
+        dates = df['date'].tolist() if 'date' in df.columns else [None] * total_rows
+        tickers = df['ticker'].tolist() if 'ticker' in df.columns else [None] * total_rows
+
+        row_seeds = np.random.SeedSequence(self.random_seed).spawn(total_rows)
+        tasks = [
+            (E_arr[i], sigma_E_arr[i], D_arr[i], r_arr[i], T_arr[i], mu_arr[i],
+             dates[i], tickers[i], self.n_iterations, self.confidence_level,
+             int(row_seeds[i].generate_state(1)[0]), se_sigma_E, se_mu)
+            for i in range(total_rows)
+        ]
+
+        # Large runs on the GPU: solve every row's draws as one stacked batch
+        if self.device == 'cuda' and total_rows * self.n_iterations > GPU_MIN_WORK:
+            results_df = pd.DataFrame(_bootstrap_rows_stacked(tasks, self.device))
             if show_progress:
-                print(f"Bootstrap progress: {idx + 1}/{total_rows}", end='\r')
-
-            bootstrap_result = self.run_bootstrap(
-                E=row['E'],
-                sigma_E=row['sigma_E'],
-                D=row['D'],
-                r=row['r'],
-                T=row['T'],
-                mu=row.get('mu', 0.02),  # Default mu if not present
-                se_sigma_E=se_sigma_E,
-                se_mu=se_mu
-            )
-
-            # Flatten results for DataFrame
-            flat_result = {
-                'date': row.get('date'),
-                'ticker': row.get('ticker'),
-                'convergence_rate': bootstrap_result['convergence_rate'],
-                'V_median': bootstrap_result['V']['median'],
-                'V_lower': bootstrap_result['V']['ci_lower'],
-                'V_upper': bootstrap_result['V']['ci_upper'],
-                'sigma_V_median': bootstrap_result['sigma_V']['median'],
-                'sigma_V_lower': bootstrap_result['sigma_V']['ci_lower'],
-                'sigma_V_upper': bootstrap_result['sigma_V']['ci_upper'],
-                'DD_median': bootstrap_result['DD']['median'],
-                'DD_lower': bootstrap_result['DD']['ci_lower'],
-                'DD_upper': bootstrap_result['DD']['ci_upper'],
-                'PD_median': bootstrap_result['PD']['median'],
-                'PD_lower': bootstrap_result['PD']['ci_lower'],
-                'PD_upper': bootstrap_result['PD']['ci_upper']
-            }
-
-            results.append(flat_result)
+                print(f"Bootstrap complete: {total_rows} rows processed on {self.device}")
+            return results_df
+
+        if n_jobs is None:
+            n_jobs = os.cpu_count() or 1
+
+        # Daemonic processes (e.g. some task-runner workers) cannot fork
+        # children, so fall back to running serially there
+        if n_jobs > 1 and total_rows > 1 and not mp.current_process().daemon:
+            pool = mp.Pool(processes=min(n_jobs, total_rows))
+            row_results = pool.imap(_bootstrap_row, tasks, chunksize=4)
+        else:
+            pool = None
+            row_results = map(_bootstrap_row, tasks)
+
+        if show_progress and tqdm is not None:
+            row_results = tqdm(row_results, total=total_rows, desc="Bootstrap")
+
+        # Without tqdm, redraw the progress line about once per percent
+        print_progress = show_progress and tqdm is None
+        report_every = max(1, total_rows // 100)
+
+        results = []
+
+        try:
+            for i, flat_result in enumerate(row_results, start=1):
+                if print_progress and (i % report_every == 0 or i == total_rows):
+                    print(f"Bootstrap progress: {i}/{total_rows}", end='\r')
+                results.append(flat_result)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
 
         if show_progress:
             print(f"\nBootstrap complete: {total_rows} rows processed")
@@ -212,29 +210,214 @@ class BootstrapUncertainty:
 
         return results_df
 
-    def _draw_positive_normal(self, mean: float, std: float) -> float:
-        """Draw from normal distribution, ensuring positive value."""
-        value = np.random.normal(mean, std)
+    def _draw_inputs(
+            self,
+            sigma_E: float,
+            D: float,
+            mu: float,
+            se_sigma_E: Optional[float],
+            se_mu: Optional[float],
+            pct_noise_D: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Draw n_iterations noisy (σ_E, D, μ) inputs; equity is held fixed."""
+        # Set default standard errors if not provided
+        if se_sigma_E is None:
+            se_sigma_E = sigma_E * 0.1  # 10% of equity volatility
+
+        if se_mu is None:
+            se_mu = abs(mu) * 0.5 if mu != 0 else 0.01  # 50% of mu
+
+        n = self.n_iterations
 
-        # Keep redrawing until positive (simple rejection sampling)
-        while value <= 0:
-            value = np.random.normal(mean, std)
+        sigma_E_draws = self._draw_positive_normal(sigma_E, se_sigma_E, n)
+        D_draws = D * np.exp(self.rng.normal(0, pct_noise_D, n))  # Lognormal noise
+        mu_draws = self.rng.normal(mu, se_mu, n)
 
-        return value
+        return sigma_E_draws, D_draws, mu_draws
 
-    def _compute_stats(self, samples: list) -> Dict:
+    def _summarize(
+            self,
+            solved: Dict[str, np.ndarray],
+            D_draws: np.ndarray,
+            mu_draws: np.ndarray,
+            T: float,
+            keep_samples: bool = False
+    ) -> Dict:
+        """Turn solved draws into DD/PD samples and summary statistics."""
+        # Keep converged samples only
+        ok_mask = solved['converged']
+        n_ok = int(np.count_nonzero(ok_mask))
+        V_samples = solved['V'][ok_mask]
+        sigma_V_samples = solved['sigma_V'][ok_mask]
+        D_arr = D_draws[ok_mask]
+        mu_arr = mu_draws[ok_mask]
+
+        # Calculate DD and PD (real-world) for all draws in one array pass
+        DD_samples = calculate_dd_real_world(V_samples, D_arr, sigma_V_samples, mu_arr, T)
+        PD_samples = calculate_pd_from_dd(DD_samples)
+
+        # V, σ_V and DD only feed percentile summaries, so float32 is ample
+        # and halves the data the quantile sort touches. PD stays float64:
+        # its far tail (DD > ~13) underflows float32.
+        V_samples = V_samples.astype(np.float32)
+        sigma_V_samples = sigma_V_samples.astype(np.float32)
+        DD_samples = DD_samples.astype(np.float32)
+
+        # Calculate statistics
+        results = {
+            'n_samples': n_ok,
+            'convergence_rate': n_ok / ok_mask.size,
+            'V': self._compute_stats(V_samples, keep_samples),
+            'sigma_V': self._compute_stats(sigma_V_samples, keep_samples),
+            'DD': self._compute_stats(DD_samples, keep_samples),
+            'PD': self._compute_stats(PD_samples, keep_samples)
+        }
+
+        return results
+
+    def _draw_positive_normal(self, mean: float, std: float, size: int) -> np.ndarray:
+        """
+        Draw `size` samples from a normal distribution truncated to (0, inf).
+
+        Uses the inverse CDF directly instead of rejection sampling, so the
+        cost is fixed even when most of the mass lies below zero.
+        """
+        # X > 0  <=>  Z < mean/std, so sample Z from the mass below mean/std
+        u = (1.0 - self.rng.random(size)) * ndtr(mean / std)
+        return mean - std * ndtri(u)
+
+    def _compute_stats(self, samples_array: np.ndarray, keep_samples: bool = False) -> Dict:
         """Compute statistics from bootstrap samples."""
-        samples_array = np.array(samples)
-
-        return {
-            'median': float(np.median(samples_array)),
-            'mean': float(np.mean(samples_array)),
-            'std': float(np.std(samples_array)),
-            'ci_lower': float(np.percentile(samples_array, self.lower_percentile)),
-            'ci_upper': float(np.percentile(samples_array, self.upper_percentile)),
-            'samples': samples_array  # Keep samples for plotting
+        # Median and both CI bounds from a single partition of the data
+        ci_lower, median, ci_upper = np.quantile(
+            samples_array,
+            [self.lower_percentile / 100, 0.5, self.upper_percentile / 100]
+        )
+
+        # Reuse the mean for the (population) std instead of letting
+        # np.std recompute it in a second reduction
+        mean = samples_array.mean()
+        std = np.sqrt(np.mean(np.square(samples_array - mean)))
+
+        stats = {
+            'median': float(median),
+            'mean': float(mean),
+            'std': float(std),
+            'ci_lower': float(ci_lower),
+            'ci_upper': float(ci_upper)
         }
 
+        if keep_samples:
+            stats['samples'] = samples_array  # Keep samples for plotting
+
+        return stats
+
+
+def _bootstrap_row(task: Tuple) -> Dict:
+    """
+    Bootstrap a single input row (process-pool worker).
+
+    Args:
+        task: (E, sigma_E, D, r, T, mu, date, ticker,
+               n_iterations, confidence_level, seed, se_sigma_E, se_mu)
+
+    Returns:
+        Flat dict of medians and confidence bounds for the row
+    """
+    (E, sigma_E, D, r, T, mu, date, ticker,
+     n_iterations, confidence_level, seed, se_sigma_E, se_mu) = task
+
+    bootstrap = BootstrapUncertainty(
+        n_iterations=n_iterations,
+        confidence_level=confidence_level,
+        random_seed=seed
+    )
+
+    bootstrap_result = bootstrap.run_bootstrap(
+        E=E,
+        sigma_E=sigma_E,
+        D=D,
+        r=r,
+        T=T,
+        mu=mu,
+        se_sigma_E=se_sigma_E,
+        se_mu=se_mu,
+        keep_samples=False
+    )
+
+    return _flatten_result(date, ticker, bootstrap_result)
+
+
+def _bootstrap_rows_stacked(tasks: List[Tuple], device: str = 'cuda') -> List[Dict]:
+    """
+    Bootstrap many rows at once by stacking their draws into one batch.
+
+    Each row keeps its own seed and draws exactly as in _bootstrap_row; only
+    the Merton solve is shared, as a (rows x n_iterations) batch on `device`.
+
+    Args:
+        tasks: Same task tuples as _bootstrap_row
+        device: 'cuda' or 'cpu'
+
+    Returns:
+        List of flat result dicts, one per row
+    """
+    bootstraps, sigma_E_draws, D_draws, mu_draws = [], [], [], []
+    for (E, sigma_E, D, r, T, mu, date, ticker,
+         n_iterations, confidence_level, seed, se_sigma_E, se_mu) in tasks:
+        bootstrap = BootstrapUncertainty(
+            n_iterations=n_iterations,
+            confidence_level=confidence_level,
+            random_seed=seed
+        )
+        sigma_E_b, D_b, mu_b = bootstrap._draw_inputs(
+            sigma_E, D, mu, se_sigma_E, se_mu, pct_noise_D=0.03
+        )
+
+        bootstraps.append(bootstrap)
+        sigma_E_draws.append(sigma_E_b)
+        D_draws.append(D_b)
+        mu_draws.append(mu_b)
+
+    # Per-row scalars as columns so they broadcast across each row's draws
+    E_col, r_col, T_col = (
+        np.array([task[i] for task in tasks], dtype=np.float64)[:, None]
+        for i in (0, 3, 4)
+    )
+
+    solved = MertonSolver().solve_batch(
+        E_col, np.stack(sigma_E_draws), np.stack(D_draws), r_col, T_col, device=device
+    )
+
+    results = []
+    for i, (bootstrap, task) in enumerate(zip(bootstraps, tasks)):
+        row_solved = {key: value[i] for key, value in solved.items()}
+        bootstrap_result = bootstrap._summarize(row_solved, D_draws[i], mu_draws[i], task[4])
+        results.append(_flatten_result(task[6], task[7], bootstrap_result))
+
+    return results
+
+
+def _flatten_result(date, ticker, bootstrap_result: Dict) -> Dict:
+    """Flatten a run_bootstrap result into one DataFrame row."""
+    return {
+        'date': date,
+        'ticker': ticker,
+        'convergence_rate': bootstrap_result['convergence_rate'],
+        'V_median': bootstrap_result['V']['median'],
+        'V_lower': bootstrap_result['V']['ci_lower'],
+        'V_upper': bootstrap_result['V']['ci_upper'],
+        'sigma_V_median': bootstrap_result['sigma_V']['median'],
+        'sigma_V_lower': bootstrap_result['sigma_V']['ci_lower'],
+        'sigma_V_upper': bootstrap_result['sigma_V']['ci_upper'],
+        'DD_median': bootstrap_result['DD']['median'],
+        'DD_lower': bootstrap_result['DD']['ci_lower'],
+        'DD_upper': bootstrap_result['DD']['ci_upper'],
+        'PD_median': bootstrap_result['PD']['median'],
+        'PD_lower': bootstrap_result['PD']['ci_lower'],
+        'PD_upper': bootstrap_result['PD']['ci_upper']
+    }
+
 
 def run_bootstrap_analysis(
         ticker: str,
@@ -254,10 +437,10 @@ def run_bootstrap_analysis(
     Returns:
         DataFrame with bootstrap confidence intervals
     """
-    from features.merton_inputs import build_merton_inputs
+    from features.merton_inputs import build_merton_inputs_cached
 
     # Load Merton inputs
-    inputs = build_merton_inputs(ticker, engine)
+    inputs = build_merton_inputs_cached(ticker, engine)
 
     if inputs.empty:
         raise ValueError(f"No Merton inputs found for {ticker}")
@@ -7,19 +7,76 @@ Maps theoretical Distance-to-Default to empirical default probabilities
 using historical default data.
 """
 
+import warnings
+
 import numpy as np
 import pandas as pd
 from typing import Optional, Dict, Tuple
-from scipy.stats import norm
+from scipy.special import expit, ndtr
+
+
+def _logit_predict(b0: float, b1: float, x: np.ndarray) -> np.ndarray:
+    """Evaluate the logistic curve 1 / (1 + exp(-(b0 + b1·x))) elementwise."""
+    return expit(b0 + b1 * x)
+
+
+def _fit_logit_1d(
+        x: np.ndarray,
+        y: np.ndarray,
+        C: float = 1.0,
+        max_iter: int = 25,
+        tol: float = 1e-10
+) -> Tuple[float, float]:
+    """
+    Fit a one-feature logistic regression by Newton-Raphson (IRLS).
 
-try:
-    from sklearn.linear_model import LogisticRegression
-    from sklearn.metrics import roc_auc_score, classification_report
+    Minimizes the log-loss plus an L2 penalty of slope² / (2C) on the slope
+    only, i.e. the same objective as sklearn's LogisticRegression defaults.
+    The penalty keeps the fit finite on (quasi-)separable data.
+
+    Args:
+        x: Feature values
+        y: Binary targets (0/1)
+        C: Inverse regularization strength
+        max_iter: Maximum Newton iterations
+        tol: Convergence tolerance on the Newton step
+
+    Returns:
+        (intercept, slope)
+
+    Raises:
+        ValueError: If y does not contain both classes
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
 
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
-    print("Warning: scikit-learn not installed. Calibration features limited.")
+    # With one class the intercept has no finite optimum
+    if np.unique(y).size < 2:
+        raise ValueError("Need both defaults and non-defaults (two classes in y) to fit")
+
+    X = np.column_stack([np.ones_like(x), x])
+    penalty = np.array([0.0, 1.0 / C])  # Intercept is not penalized
+    beta = np.zeros(2)
+
+    for _ in range(max_iter):
+        p = _logit_predict(beta[0], beta[1], x)
+        w = p * (1.0 - p)
+
+        grad = X.T @ (p - y) + penalty * beta
+        hess = (X.T * w) @ X + np.diag(penalty)
+
+        step = np.linalg.solve(hess, grad)
+        beta -= step
+
+        if np.max(np.abs(step)) < tol:
+            break
+    else:
+        warnings.warn(
+            f"Logistic fit did not converge in {max_iter} iterations "
+            f"(last step {np.max(np.abs(step)):.2e} > tol {tol:.0e})"
+        )
+
+    return float(beta[0]), float(beta[1])
 
 
 class PDCalibrator:
@@ -29,12 +86,10 @@ class PDCalibrator:
 
     def __init__(self):
         """Initialize calibrator."""
-        if not SKLEARN_AVAILABLE:
-            raise ImportError("scikit-learn required for calibration. Install with: pip install scikit-learn")
-
-        self.model = None
         self.is_fitted = False
         self.coefficients = None
+        self._b0 = None
+        self._b1 = None
 
     def fit(
             self,
@@ -51,18 +106,11 @@ class PDCalibrator:
         Returns:
             Self (fitted model)
         """
-        # Reshape for sklearn
-        X = DD_values.reshape(-1, 1)
-        y = default_flags
-
-        # Fit logistic regression
-        self.model = LogisticRegression(random_state=42)
-        self.model.fit(X, y)
+        self._b0, self._b1 = _fit_logit_1d(DD_values, default_flags)
 
-        # Extract coefficients
         self.coefficients = {
-            'intercept': float(self.model.intercept_[0]),
-            'slope': float(self.model.coef_[0][0])
+            'intercept': self._b0,
+            'slope': self._b1
         }
 
         self.is_fitted = True
@@ -82,10 +130,7 @@ class PDCalibrator:
         if not self.is_fitted:
             raise ValueError("Model must be fitted before prediction")
 
-        DD_array = np.array([[DD]])
-        pd_calibrated = self.model.predict_proba(DD_array)[0, 1]
-
-        return float(pd_calibrated)
+        return float(self.predict_pd_batch(np.array([DD]))[0])
 
     def predict_pd_batch(self, DD_values: np.ndarray) -> np.ndarray:
         """
@@ -100,10 +145,7 @@ class PDCalibrator:
         if not self.is_fitted:
             raise ValueError("Model must be fitted before prediction")
 
-        X = DD_values.reshape(-1, 1)
-        pd_calibrated = self.model.predict_proba(X)[:, 1]
-
-        return pd_calibrated
+        return _logit_predict(self._b0, self._b1, np.asarray(DD_values, dtype=float))
 
     def compare_methods(
             self,
@@ -121,7 +163,7 @@ class PDCalibrator:
             DataFrame with DD, raw PD, calibrated PD
         """
         # Raw PD (standard normal)
-        pd_raw = norm.cdf(-DD_values)
+        pd_raw = ndtr(-np.asarray(DD_values, dtype=float))
 
         # Calibrated PD
         pd_calibrated = self.predict_pd_batch(DD_values)
@@ -7,17 +7,49 @@ using both risk-neutral and real-world approaches.
 
 import numpy as np
 import pandas as pd
-from scipy.stats import norm
-from typing import Optional
+from scipy.special import ndtr
+from typing import Optional, Union
+
+# Periods per year for annualizing mean log-returns
+ANNUALIZATION = {'daily': 252.0, 'monthly': 12.0, 'annual': 1.0}
+
+
+def _dd_kernel(
+        V: Union[float, np.ndarray],
+        D: Union[float, np.ndarray],
+        sigma_V: Union[float, np.ndarray],
+        drift: Union[float, np.ndarray],
+        T: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """
+    Distance to Default for a given asset drift, elementwise.
+
+    Shared by the risk-neutral (drift = r) and real-world (drift = μ)
+    variants. Inputs with non-positive V, D, σ_V or T give NaN.
+
+    Returns:
+        float for scalar inputs, array otherwise
+    """
+    V, D, sigma_V, drift, T = (
+        np.asarray(x, dtype=float) for x in (V, D, sigma_V, drift, T)
+    )
+
+    invalid = (V <= 0) | (D <= 0) | (sigma_V <= 0) | (T <= 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        DD = (np.log(V / D) + (drift - 0.5 * sigma_V * sigma_V) * T) / (sigma_V * np.sqrt(T))
+
+    DD = np.where(invalid, np.nan, DD)
+    return float(DD) if DD.ndim == 0 else DD
 
 
 def calculate_dd_risk_neutral(
-        V: float,
-        D: float,
-        sigma_V: float,
-        r: float,
-        T: float
-) -> float:
+        V: Union[float, np.ndarray],
+        D: Union[float, np.ndarray],
+        sigma_V: Union[float, np.ndarray],
+        r: Union[float, np.ndarray],
+        T: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Calculate risk-neutral Distance to Default.
 
@@ -34,27 +66,19 @@ def calculate_dd_risk_neutral(
         T: Time to maturity
 
     Returns:
-        Distance to default (in standard deviations)
+        Distance to default (in standard deviations); scalar inputs give a
+        float, array inputs an array
     """
-    if V <= 0 or D <= 0 or sigma_V <= 0 or T <= 0:
-        return np.nan
-
-    try:
-        numerator = np.log(V / D) + (r - 0.5 * sigma_V ** 2) * T
-        denominator = sigma_V * np.sqrt(T)
-        DD = numerator / denominator
-        return DD
-    except (ValueError, ZeroDivisionError):
-        return np.nan
+    return _dd_kernel(V, D, sigma_V, r, T)
 
 
 def calculate_dd_real_world(
-        V: float,
-        D: float,
-        sigma_V: float,
-        mu: float,
-        T: float
-) -> float:
+        V: Union[float, np.ndarray],
+        D: Union[float, np.ndarray],
+        sigma_V: Union[float, np.ndarray],
+        mu: Union[float, np.ndarray],
+        T: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Calculate real-world Distance to Default.
 
@@ -71,41 +95,28 @@ def calculate_dd_real_world(
         T: Time to maturity
 
     Returns:
-        Distance to default (in standard deviations)
+        Distance to default (in standard deviations); scalar inputs give a
+        float, array inputs an array
     """
-    if V <= 0 or D <= 0 or sigma_V <= 0 or T <= 0:
-        return np.nan
+    return _dd_kernel(V, D, sigma_V, mu, T)
 
-    try:
-        numerator = np.log(V / D) + (mu - 0.5 * sigma_V ** 2) * T
-        denominator = sigma_V * np.sqrt(T)
-        DD = numerator / denominator
-        return DD
-    except (ValueError, ZeroDivisionError):
-        return np.nan
 
-
-def calculate_pd_from_dd(DD: float) -> float:
+def calculate_pd_from_dd(DD: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """
     Calculate Probability of Default from Distance to Default.
 
-    Uses standard normal CDF: PD = Φ(-DD)
+    Uses standard normal CDF: PD = Φ(-DD), evaluated with scipy.special.ndtr
+    (the C routine behind norm.cdf, without the rv_continuous dispatch).
 
     Args:
-        DD: Distance to default
+        DD: Distance to default (scalar or array)
 
     Returns:
-        Probability of default (0 to 1)
+        Probability of default (0 to 1); float for scalar input, array
+        otherwise. NaN DD propagates to NaN PD.
     """
-    if np.isnan(DD):
-        return np.nan
-
-    try:
-        # Explicit float conversion to satisfy type checkers
-        PD = float(norm.cdf(-float(DD)))
-        return PD
-    except (ValueError, TypeError):
-        return np.nan
+    PD = ndtr(-np.asarray(DD, dtype=float))
+    return float(PD) if PD.ndim == 0 else PD
 
 
 def calculate_pd_risk_neutral(
@@ -156,26 +167,28 @@ def estimate_mu_from_asset_series(
         frequency: 'daily', 'monthly', 'annual'
 
     Returns:
-        Annualized mean log-return (μ)
+        Annualized mean log-return (μ), or NaN if any asset value is
+        missing or non-positive (e.g. a non-converged solve)
     """
     arr = np.array(asset_values, dtype=float)
 
     if arr.size < 2:
         raise ValueError("Need at least 2 observations to estimate returns")
 
-    # Calculate log returns
-    log_returns = np.diff(np.log(arr))
-    mean_lr = np.mean(log_returns)
-
-    # Annualize based on frequency
-    if frequency == 'daily':
-        return mean_lr * 252.0
-    elif frequency == 'monthly':
-        return mean_lr * 12.0
-    elif frequency == 'annual':
-        return mean_lr
-    else:
-        raise ValueError("frequency must be 'daily', 'monthly', or 'annual'")
+    try:
+        periods_per_year = ANNUALIZATION[frequency]
+    except KeyError:
+        raise ValueError("frequency must be 'daily', 'monthly', or 'annual'") from None
+
+    # Every log return must be defined, as in the per-period mean; the
+    # shortcut below only reads the endpoints
+    if not (np.isfinite(arr).all() and (arr > 0).all()):
+        return np.nan
+
+    # Mean of the log returns telescopes to log(last/first) / n_returns
+    mean_lr = np.log(arr[-1] / arr[0]) / (arr.size - 1)
+
+    return mean_lr * periods_per_year
 
 
 def shrink_mu(
@@ -221,26 +234,25 @@ def add_dd_pd_to_dataframe(
     df = df.copy()
 
     if method == 'risk_neutral':
-        df['DD'] = df.apply(
-            lambda row: calculate_dd_risk_neutral(
-                row['V'], row['D'], row['sigma_V'], row['r'], row['T']
-            ),
-            axis=1
-        )
+        drift = df['r'].to_numpy(dtype=float)
     elif method == 'real_world':
         if mu_col is None:
             raise ValueError("mu_col required for real_world method")
-        df['DD'] = df.apply(
-            lambda row: calculate_dd_real_world(
-                row['V'], row['D'], row['sigma_V'], row[mu_col], row['T']
-            ),
-            axis=1
-        )
+        drift = df[mu_col].to_numpy(dtype=float)
     else:
         raise ValueError("method must be 'risk_neutral' or 'real_world'")
 
+    # Column-wise DD for the whole frame
+    df['DD'] = _dd_kernel(
+        df['V'].to_numpy(dtype=float),
+        df['D'].to_numpy(dtype=float),
+        df['sigma_V'].to_numpy(dtype=float),
+        drift,
+        df['T'].to_numpy(dtype=float)
+    )
+
     # Calculate PD from DD
-    df['PD'] = df['DD'].apply(calculate_pd_from_dd)
+    df['PD'] = calculate_pd_from_dd(df['DD'].to_numpy())
 
     return df
 
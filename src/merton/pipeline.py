@@ -11,10 +11,16 @@ Orchestrates:
 5. Store to database
 """
 
+import copy
+import functools
+import multiprocessing as mp
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union
 from sqlalchemy import text
+from sqlalchemy.types import Boolean, Date, Float, Integer, String
 
 try:
     from src.merton.solver import MertonSolver
@@ -28,6 +34,56 @@ except ImportError:
 
 logger = get_logger('merton.pipeline')
 
+# Explicit merton_outputs column types for to_sql (matches src/db/schema.sql),
+# so pandas doesn't infer an SQL type per column on every store
+_MERTON_OUTPUTS_DTYPES = {
+    'ticker': String(),
+    'date': Date(),
+    'asset_value': Float(),
+    'asset_volatility': Float(),
+    'distance_to_default': Float(),
+    'probability_default': Float(),
+    'd1': Float(),
+    'd2': Float(),
+    'converged': Boolean(),
+    'iterations': Integer(),
+    'solver_method': String(),
+    'leverage_ratio': Float(),
+    'equity_to_asset_ratio': Float()
+}
+
+# Initial-guess columns carried from a ticker's previous solve
+_WARM_START_COLS = ('V0', 'sigma_V0')
+
+# Output columns written to merton_outputs (before renaming to the schema)
+_BASE_STORE_COLS = (
+    'ticker', 'date', 'V', 'sigma_V', 'DD', 'PD',
+    'd1', 'd2', 'converged', 'iterations', 'solver_method'
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_merton_config() -> Dict:
+    """Read config/merton.yaml once per process (defaults if unavailable)."""
+    try:
+        from src.utils.config_loader import get_config
+        return get_config('merton')
+    except (ImportError, FileNotFoundError):
+        # Fallback to defaults if config file not found
+        logger.warning("Config file not found, using defaults")
+        return {
+            'solver': {
+                'max_iterations': 2000,
+                'tolerance': 1e-12,
+                'min_sigma': 1e-4,
+                'max_sigma': 3.0,
+                'initial_guess_method': 'kmv'
+            },
+            'model': {
+                'time_to_maturity': 1.0
+            }
+        }
+
 
 class MertonPipeline:
     """
@@ -39,7 +95,8 @@ class MertonPipeline:
             engine,
             config: Optional[Dict] = None,
             use_real_world: bool = False,
-            mu_default: float = 0.02
+            mu_default: float = 0.02,
+            cache_dir: Optional[Union[str, Path]] = None
     ):
         """
         Initialize Merton pipeline.
@@ -49,10 +106,13 @@ class MertonPipeline:
             config: Configuration dict (if None, loads from config/merton.yaml)
             use_real_world: Use real-world vs risk-neutral DD/PD
             mu_default: Default asset drift if not estimated
+            cache_dir: Optional directory for a Parquet cache of Merton
+                inputs that persists across runs (None = in-process only)
         """
         self.engine = engine
         self.use_real_world = use_real_world
         self.mu_default = mu_default
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
         # Load configuration
         if config is None:
@@ -66,35 +126,22 @@ class MertonPipeline:
             tolerance=solver_config.get('tolerance', 1e-12),
             min_sigma=solver_config.get('min_sigma', 1e-4),
             max_sigma=solver_config.get('max_sigma', 3.0),
-            initial_guess_method=solver_config.get('initial_guess_method', 'scaled')
+            initial_guess_method=solver_config.get('initial_guess_method', 'kmv')
         )
+        # Last converged (V, σ_V) per ticker, indexed by date, used to
+        # warm-start re-runs over overlapping dates
+        self._warm_state: Dict[str, pd.DataFrame] = {}
 
     def _load_config(self) -> Dict:
         """Load configuration from file with fallback to defaults."""
-        try:
-            from src.utils.config_loader import get_config
-            return get_config('merton')
-        except (ImportError, FileNotFoundError):
-            # Fallback to defaults if config file not found
-            logger.warning("Config file not found, using defaults")
-            return {
-                'solver': {
-                    'max_iterations': 2000,
-                    'tolerance': 1e-12,
-                    'min_sigma': 1e-4,
-                    'max_sigma': 3.0,
-                    'initial_guess_method': 'scaled'
-                },
-                'model': {
-                    'time_to_maturity': 1.0
-                }
-            }
+        # Deep copy so one pipeline can't mutate another's config
+        return copy.deepcopy(_cached_merton_config())
 
     def run_for_ticker(
             self,
             ticker: str,
             store_results: bool = True,
-            validate: bool = True
+            validate: Union[bool, str] = True
     ) -> pd.DataFrame:
         """
         Run complete Merton pipeline for a single ticker.
@@ -102,7 +149,7 @@ class MertonPipeline:
         Args:
             ticker: Stock ticker
             store_results: Whether to store to database
-            validate: Whether to validate outputs
+            validate: 'full', 'fast' or 'off' (True/False mean 'full'/'off')
 
         Returns:
             DataFrame with Merton outputs
@@ -119,16 +166,51 @@ class MertonPipeline:
 
         logger.info(f"  Loaded {len(inputs)} rows")
 
-        # Step 2: Solve Merton model
+        # Steps 2-3: Solve Merton model, calculate DD and PD
+        results = self._solve_and_score(self._attach_warm_start(inputs, ticker))
+        self._remember_solution(ticker, results)
+
+        # Step 4: Add metadata
+        results['ticker'] = ticker
+
+        # Step 5: Validate
+        self._run_validation(results, ticker, validate)
+
+        # Step 6: Store to database
+        if store_results:
+            self._store_results(results)
+            self._refresh_latest_view()
+            logger.info(f"  Stored {len(results)} rows to database")
+
+        logger.info(f"✅ Completed {ticker}")
+
+        return results
+
+    def _solve_and_score(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        """
+        Solve the Merton model and add DD/PD for a frame of inputs.
+
+        Rows are independent, so inputs may hold one ticker or many.
+
+        Args:
+            inputs: DataFrame with E, D, sigma_E, r, T (and optionally
+                V0/sigma_V0 initial guesses)
+
+        Returns:
+            DataFrame with solver outputs, DD, PD and solver_method
+        """
         logger.info(f"  Solving Merton model...")
-        results = self.solver.solve_dataframe(inputs)
+        results = self.solver.solve_dataframe(
+            inputs,
+            warm_start_cols=_WARM_START_COLS,
+            group_col='ticker' if 'ticker' in inputs.columns else None
+        ).drop(columns=list(_WARM_START_COLS), errors='ignore')
 
         # Check convergence
         converged_count = int(results['converged'].sum())
         total_count = len(results)
         logger.info(f"  Converged: {converged_count}/{total_count}")
 
-        # Step 3: Calculate DD and PD
         logger.info(f"  Calculating DD and PD...")
 
         if self.use_real_world:
@@ -139,70 +221,198 @@ class MertonPipeline:
         else:
             results = add_dd_pd_to_dataframe(results, method='risk_neutral')
 
-        # Step 4: Add metadata
-        results['ticker'] = ticker
-        results['solver_method'] = 'kmv_fsolve'
+        # Per-row provenance: which path converged, or the configured
+        # strategy for rows that did not
+        results['solver_method'] = 'kmv_' + results.pop('method').fillna(self.solver.method)
 
-        # Step 5: Validate
-        if validate:
-            validation_results = self._validate_outputs(results, ticker)
-            if not validation_results['passed']:
-                logger.warning(f"  Validation warnings for {ticker}")
-                for warning in validation_results.get('warnings', []):
-                    logger.warning(f"    {warning}")
+        return results
 
-        # Step 6: Store to database
-        if store_results:
-            self._store_results(results)
-            logger.info(f"  Stored {len(results)} rows to database")
+    def _attach_warm_start(self, inputs: pd.DataFrame, ticker: str) -> pd.DataFrame:
+        """
+        Add V0/sigma_V0 initial-guess columns from this ticker's last run.
 
-        logger.info(f"✅ Completed {ticker}")
+        Dates solved before reuse that solution; new dates get NaN and
+        start from the solver's default guess.
+        """
+        state = self._warm_state.get(ticker)
+        if state is None:
+            return inputs
+
+        dates = pd.to_datetime(inputs['date'], cache=True)
+        guesses = state.reindex(dates)
+        return inputs.assign(**{
+            col: guesses[col].to_numpy() for col in _WARM_START_COLS
+        })
 
-        return results
+    def _remember_solution(self, ticker: str, results: pd.DataFrame):
+        """Keep converged (V, sigma_V) by date as the ticker's next warm start."""
+        converged = results['converged'].to_numpy(dtype=bool)
+        solved = results.loc[converged, ['date', 'V', 'sigma_V']]
+
+        state = pd.DataFrame(
+            {'V0': solved['V'].to_numpy(), 'sigma_V0': solved['sigma_V'].to_numpy()},
+            index=pd.DatetimeIndex(pd.to_datetime(solved['date'], cache=True))
+        )
+        self._warm_state[ticker] = state[~state.index.duplicated(keep='last')]
 
     def run_for_tickers(
             self,
             tickers: List[str],
             store_results: bool = True,
-            validate: bool = True
+            validate: Union[bool, str] = True,
+            n_jobs: int = 1
     ) -> Dict[str, pd.DataFrame]:
         """
         Run Merton pipeline for multiple tickers.
 
+        Tickers are independent, so with n_jobs > 1 they are split into
+        chunks and solved in a process pool. Workers rebuild their own
+        engine from the connection URL and never write; results are stored
+        from this process afterwards so the database sees a single writer.
+
         Args:
             tickers: List of ticker symbols
             store_results: Whether to store to database
-            validate: Whether to validate outputs
+            validate: 'full', 'fast' or 'off' (True/False mean 'full'/'off')
+            n_jobs: Worker processes (1 = serial in this process)
 
         Returns:
             Dictionary mapping ticker -> results DataFrame
         """
+        # Daemonic processes (e.g. some task-runner workers) cannot fork
+        # children, so fall back to running serially there
+        if n_jobs <= 1 or len(tickers) <= 1 or mp.current_process().daemon:
+            return self._run_ticker_list(tickers, store_results, validate)
+
+        engine_url = self.engine.url.render_as_string(hide_password=False)
+        chunks = [
+            (engine_url, self.config, self.use_real_world, self.mu_default, self.cache_dir,
+             list(chunk), validate)
+            for chunk in np.array_split(np.asarray(tickers, dtype=object), n_jobs * 2)
+            if len(chunk)
+        ]
+
+        with mp.Pool(processes=min(n_jobs, len(chunks))) as pool:
+            chunk_results = pool.map(_run_ticker_chunk, chunks)
+
         results = {}
+        for chunk_result in chunk_results:
+            results.update(chunk_result)
+
+        if store_results:
+            for ticker, ticker_results in results.items():
+                try:
+                    self._store_results(ticker_results)
+                    logger.info(f"  Stored {len(ticker_results)} rows to database for {ticker}")
+                except Exception as e:
+                    logger.error(f"❌ Failed to store {ticker}: {e}")
+            self._refresh_latest_view()
 
+        return results
+
+    def _run_ticker_list(
+            self,
+            tickers: List[str],
+            store_results: bool,
+            validate: Union[bool, str]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Run tickers in this process with a single solve over all of them.
+
+        Inputs are loaded per ticker, concatenated, solved and scored once,
+        then split back by ticker for validation and storage. If the joint
+        solve raises, each ticker is solved separately instead.
+        """
+        import traceback
+
+        # Step 1: Load every ticker's inputs
+        frames = []
         for ticker in tickers:
             try:
-                ticker_results = self.run_for_ticker(
-                    ticker,
-                    store_results=store_results,
-                    validate=validate
-                )
+                inputs = self._load_merton_inputs(ticker)
+            except Exception as e:
+                logger.error(f"❌ Failed for {ticker}: {e}")
+                logger.error(traceback.format_exc())
+                continue
+
+            if inputs.empty:
+                logger.warning(f"  No Merton inputs found for {ticker}")
+                continue
+
+            frames.append(self._attach_warm_start(inputs, ticker).assign(ticker=ticker))
+
+        if not frames:
+            return {}
+
+        all_inputs = pd.concat(frames, ignore_index=True)
+        logger.info(f"Running Merton pipeline for {len(frames)} tickers ({len(all_inputs)} rows)")
+
+        # Steps 2-4: One solve + DD/PD pass over the union
+        try:
+            all_results = self._solve_and_score(all_inputs)
+        except Exception as e:
+            # Isolate the failure: solve each ticker on its own so one bad
+            # ticker can't drop the whole batch
+            logger.error(f"❌ Batch solve failed, retrying per ticker: {e}")
+            logger.error(traceback.format_exc())
+            solved = []
+            for frame in frames:
+                ticker = frame['ticker'].iloc[0]
+                try:
+                    solved.append(self._solve_and_score(frame))
+                except Exception as e:
+                    logger.error(f"❌ Failed for {ticker}: {e}")
+                    logger.error(traceback.format_exc())
+
+            if not solved:
+                return {}
+            all_results = pd.concat(solved, ignore_index=True)
+
+        # Steps 5-6: Validate and store per ticker
+        results = {}
+        for ticker, ticker_results in all_results.groupby('ticker', sort=False):
+            ticker_results = ticker_results.reset_index(drop=True)
+            self._remember_solution(ticker, ticker_results)
+            try:
+                self._run_validation(ticker_results, ticker, validate)
+
+                if store_results:
+                    self._store_results(ticker_results)
+                    logger.info(f"  Stored {len(ticker_results)} rows to database for {ticker}")
+
                 results[ticker] = ticker_results
+                logger.info(f"✅ Completed {ticker}")
             except Exception as e:
                 logger.error(f"❌ Failed for {ticker}: {e}")
-                import traceback
                 logger.error(traceback.format_exc())
 
+        if store_results and results:
+            self._refresh_latest_view()
+
         return results
 
     def _load_merton_inputs(self, ticker: str) -> pd.DataFrame:
         """
         Load Merton inputs from database.
 
-        Uses the build_merton_inputs function from features.
+        Uses the memoized build_merton_inputs from features, so repeated
+        runs for a ticker in one process don't rebuild the inputs until its
+        source data changes. With a cache_dir, inputs are also cached as
+        Parquet across runs.
         """
-        from features.merton_inputs import build_merton_inputs
-
-        return build_merton_inputs(
+        from features.merton_inputs import build_merton_inputs_cached, load_merton_inputs_parquet
+
+        if self.cache_dir is not None:
+            return load_merton_inputs_parquet(
+                ticker,
+                self.engine,
+                self.cache_dir,
+                time_to_maturity=1.0,
+                volatility_method='rolling',
+                volatility_window=252
+            )
+
+        return build_merton_inputs_cached(
             ticker,
             self.engine,
             time_to_maturity=1.0,
@@ -210,55 +420,51 @@ class MertonPipeline:
             volatility_window=252
         )
 
+    @classmethod
+    def clear_inputs_cache(cls):
+        """Forget memoized Merton inputs (new data already invalidates them)."""
+        from features.merton_inputs import clear_merton_inputs_cache
+
+        clear_merton_inputs_cache()
+
+    def _run_validation(self, df: pd.DataFrame, ticker: str, validate: Union[bool, str]):
+        """Validate outputs in the requested mode and log anything found."""
+        mode = _validation_mode(validate)
+        if mode == 'off':
+            return
+
+        validation_results = self._validate_outputs(df, ticker, mode=mode)
+        if not validation_results['passed']:
+            logger.warning(f"  Validation issues for {ticker}")
+            for issue in validation_results['issues']:
+                logger.warning(f"    {issue}")
+        if validation_results['warnings']:
+            logger.warning(f"  Validation warnings for {ticker}")
+            for warning in validation_results['warnings']:
+                logger.warning(f"    {warning}")
+
     @staticmethod
-    def _validate_outputs(df: pd.DataFrame, ticker: str) -> Dict:
+    def _validate_outputs(df: pd.DataFrame, ticker: str, mode: str = 'full') -> Dict:
         """
         Validate Merton model outputs.
 
         Args:
             df: DataFrame with Merton outputs
             ticker: Ticker symbol
+            mode: 'full' runs every check; 'fast' stops at the first finding
 
         Returns:
             Validation results dictionary
         """
-        warnings = []
-        issues = []
+        findings = _validation_findings(df)
+        if mode == 'fast':
+            first = next(findings, None)
+            findings = [first] if first is not None else []
 
-        # Check for non-converged rows
-        if 'converged' in df.columns:
-            non_converged = (~df['converged']).sum()
-            if non_converged > 0:
-                pct = non_converged / len(df) * 100
-                warnings.append(f"Non-converged: {non_converged} rows ({pct:.1f}%)")
-
-        # Check V > E (asset value should exceed equity)
-        if 'V' in df.columns and 'E' in df.columns:
-            invalid_V = (df['V'] <= df['E']).sum()
-            if invalid_V > 0:
-                warnings.append(f"V <= E: {invalid_V} rows (unexpected)")
-
-        # Check sigma_V < sigma_E (asset vol should be less than equity vol)
-        if 'sigma_V' in df.columns and 'sigma_E' in df.columns:
-            invalid_vol = (df['sigma_V'] >= df['sigma_E']).sum()
-            if invalid_vol > 0:
-                warnings.append(f"sigma_V >= sigma_E: {invalid_vol} rows (unexpected)")
-
-        # Check PD range
-        if 'PD' in df.columns:
-            pd_stats = df['PD'].describe()
-            if pd_stats['max'] > 0.5:
-                warnings.append(f"High PD detected: max={pd_stats['max']:.2%}")
-            if pd_stats['min'] < 0 or pd_stats['max'] > 1:
-                issues.append(f"PD out of range [0,1]: [{pd_stats['min']:.4f}, {pd_stats['max']:.4f}]")
-
-        # Check DD range
-        if 'DD' in df.columns:
-            dd_stats = df['DD'].describe()
-            if dd_stats['min'] < -5:
-                warnings.append(f"Very low DD: min={dd_stats['min']:.2f}")
-            if dd_stats['max'] > 10:
-                warnings.append(f"Very high DD: max={dd_stats['max']:.2f}")
+        issues = []
+        warnings = []
+        for kind, message in findings:
+            (issues if kind == 'issue' else warnings).append(message)
 
         return {
             'ticker': ticker,
@@ -277,25 +483,23 @@ class MertonPipeline:
         if df.empty:
             return
 
-        # Select columns for storage
-        store_cols = [
-            'ticker', 'date', 'V', 'sigma_V', 'DD', 'PD',
-            'd1', 'd2', 'converged', 'iterations', 'solver_method'
-        ]
-
-        # Calculate additional metrics
-        df['leverage_ratio'] = df['D'] / df['V']
-        df['equity_to_asset_ratio'] = df['E'] / df['V']
-
-        store_cols.extend(['leverage_ratio', 'equity_to_asset_ratio'])
-
-        # Filter to columns that exist
-        store_cols = [col for col in store_cols if col in df.columns]
-
-        df_store = df[store_cols].copy()
+        # Select the storage columns that exist
+        df_cols = frozenset(df.columns)
+        store_cols = [col for col in _BASE_STORE_COLS if col in df_cols]
+
+        # Build the storage frame with the additional metrics in one step
+        # (assign returns a new frame, so the caller's df is left alone)
+        # Both ratios share the 1/V denominator: one reciprocal, two multiplies
+        inv_V = 1.0 / df['V'].to_numpy(dtype=np.float64)
+        df_store = df[store_cols].assign(
+            leverage_ratio=df['D'].to_numpy(dtype=np.float64) * inv_V,
+            equity_to_asset_ratio=df['E'].to_numpy(dtype=np.float64) * inv_V
+        )
 
-        # Convert date to date object
-        df_store['date'] = pd.to_datetime(df_store['date']).dt.date
+        # Keep dates as datetime64 (day precision) rather than an object column
+        # of datetime.date; min/max for the delete bounds are then C-level
+        dates = pd.to_datetime(df_store['date'], cache=True).to_numpy().astype('datetime64[D]')
+        df_store['date'] = dates
 
         # Rename columns to match database schema
         df_store = df_store.rename(columns={
@@ -305,10 +509,20 @@ class MertonPipeline:
             'PD': 'probability_default'
         })
 
-        # Delete existing records for this ticker and date range
+        dialect = self.engine.dialect.name
+
+        if dialect == 'postgresql':
+            # Single UPSERT on the (ticker, date) key, no separate DELETE
+            with self.engine.begin() as conn:
+                self._upsert_execute_values(conn, df_store)
+            return
+
+        # Other backends: replace existing records for this ticker and
+        # date range in one transaction
         ticker = df_store['ticker'].iloc[0]
-        min_date = df_store['date'].min()
-        max_date = df_store['date'].max()
+        # datetime64[D] -> datetime.date only for the two bound parameters
+        min_date = dates.min().astype(object)
+        max_date = dates.max().astype(object)
 
         with self.engine.begin() as conn:
             conn.execute(text("""
@@ -321,15 +535,194 @@ class MertonPipeline:
                 'max_date': max_date
             })
 
-        # Insert new records
-        df_store.to_sql(
-            'merton_outputs',
-            self.engine,
-            if_exists='append',
-            index=False,
-            method='multi'
+            # Multi-row INSERT; SQLite caps bound parameters at 999,
+            # other backends keep scaling with larger batches
+            if dialect == 'sqlite':
+                chunksize = max(1, 999 // len(df_store.columns))
+            else:
+                chunksize = 50_000
+
+            df_store.to_sql(
+                'merton_outputs',
+                conn,
+                if_exists='append',
+                index=False,
+                method='multi',
+                chunksize=chunksize,
+                dtype={
+                    col: _MERTON_OUTPUTS_DTYPES[col]
+                    for col in df_store.columns
+                    if col in _MERTON_OUTPUTS_DTYPES
+                }
+            )
+
+    def _refresh_latest_view(self):
+        """
+        Refresh the merton_latest materialized view after a batch of stores.
+
+        Postgres only; CONCURRENTLY keeps the dashboard's reads unblocked.
+        A missing view (schema.sql not applied) is logged, not raised, since
+        the outputs themselves are already stored.
+        """
+        if self.engine.dialect.name != 'postgresql':
+            return
+
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY merton_latest"))
+        except Exception as e:
+            logger.warning(f"  Could not refresh merton_latest: {e}")
+
+    @staticmethod
+    def _upsert_execute_values(conn, df_store: pd.DataFrame, page_size: int = 1000):
+        """
+        Upsert rows into merton_outputs with psycopg2's execute_values.
+
+        Postgres stops improving around 1k rows per multi-row INSERT through
+        pandas, while execute_values sends pre-rendered VALUES pages over the
+        raw driver cursor without per-row SQLAlchemy overhead. Existing rows
+        are updated in place via ON CONFLICT (ticker, date), which relies on
+        the unique (ticker, date) index from src/db/schema.sql. Updated rows
+        get created_at = NOW(), so it is the row's last write time and the
+        dashboard's MAX(created_at) watermark moves on reruns too.
+
+        Args:
+            conn: SQLAlchemy connection inside an open transaction
+            df_store: Storage frame whose columns match merton_outputs
+            page_size: Rows per INSERT statement
+        """
+        from psycopg2.extras import execute_values
+
+        # ON CONFLICT can't touch the same row twice in one statement
+        df_store = df_store.drop_duplicates(subset=['ticker', 'date'], keep='last')
+
+        columns = ', '.join(df_store.columns)
+        updates = ', '.join(
+            [f"{col} = EXCLUDED.{col}"
+             for col in df_store.columns
+             if col not in ('ticker', 'date', 'created_at')]
+            + ['created_at = NOW()']
+        )
+        # NaN -> None so missing values land as NULL, as they do through to_sql
+        rows = list(
+            df_store.astype(object)
+            .where(df_store.notna(), None)
+            .itertuples(index=False, name=None)
         )
 
+        cursor = conn.connection.cursor()
+        try:
+            execute_values(
+                cursor,
+                f"""
+                INSERT INTO merton_outputs ({columns}) VALUES %s
+                ON CONFLICT (ticker, date) DO UPDATE SET {updates}
+                """,
+                rows,
+                page_size=page_size
+            )
+        finally:
+            cursor.close()
+
+
+def _validation_mode(validate: Union[bool, str]) -> str:
+    """Normalize the validate argument to 'full', 'fast' or 'off'."""
+    if validate is True:
+        return 'full'
+    if validate is False or validate is None:
+        return 'off'
+    if validate not in ('full', 'fast', 'off'):
+        raise ValueError(f"validate must be a bool or 'full'/'fast'/'off', got {validate!r}")
+    return validate
+
+
+def _validation_findings(df: pd.DataFrame):
+    """
+    Yield ('issue' | 'warning', message) for each failed output check.
+
+    Checks run cheapest-first (column min/max before element-wise
+    comparisons) and lazily, so a caller that only wants the first
+    finding never evaluates the rest.
+    """
+    # Check PD range
+    if 'PD' in df.columns:
+        pd_min, pd_max = df['PD'].min(), df['PD'].max()
+        if pd_min < 0 or pd_max > 1:
+            yield 'issue', f"PD out of range [0,1]: [{pd_min:.4f}, {pd_max:.4f}]"
+        if pd_max > 0.5:
+            yield 'warning', f"High PD detected: max={pd_max:.2%}"
+
+    # Check DD range
+    if 'DD' in df.columns:
+        dd_min = df['DD'].min()
+        if dd_min < -5:
+            yield 'warning', f"Very low DD: min={dd_min:.2f}"
+        dd_max = df['DD'].max()
+        if dd_max > 10:
+            yield 'warning', f"Very high DD: max={dd_max:.2f}"
+
+    # Check for non-converged rows
+    if 'converged' in df.columns:
+        non_converged = int(np.count_nonzero(~df['converged'].to_numpy().astype(bool)))
+        if non_converged > 0:
+            pct = non_converged / len(df) * 100
+            yield 'warning', f"Non-converged: {non_converged} rows ({pct:.1f}%)"
+
+    # Check V > E (asset value should exceed equity)
+    if 'V' in df.columns and 'E' in df.columns:
+        invalid_V = int(np.count_nonzero(df['V'].to_numpy() <= df['E'].to_numpy()))
+        if invalid_V > 0:
+            yield 'warning', f"V <= E: {invalid_V} rows (unexpected)"
+
+    # Check sigma_V < sigma_E (asset vol should be less than equity vol)
+    if 'sigma_V' in df.columns and 'sigma_E' in df.columns:
+        invalid_vol = int(np.count_nonzero(df['sigma_V'].to_numpy() >= df['sigma_E'].to_numpy()))
+        if invalid_vol > 0:
+            yield 'warning', f"sigma_V >= sigma_E: {invalid_vol} rows (unexpected)"
+
+
+def _run_ticker_chunk(task) -> Dict[str, pd.DataFrame]:
+    """
+    Run a chunk of tickers in a worker process without storing.
+
+    Args:
+        task: (engine_url, config, use_real_world, mu_default, cache_dir, tickers, validate)
+
+    Returns:
+        Dictionary mapping ticker -> results DataFrame
+    """
+    from sqlalchemy import create_engine
+
+    engine_url, config, use_real_world, mu_default, cache_dir, tickers, validate = task
+
+    engine = create_engine(engine_url)
+    try:
+        pipeline = MertonPipeline(
+            engine,
+            config=config,
+            use_real_world=use_real_world,
+            mu_default=mu_default,
+            cache_dir=cache_dir
+        )
+        return pipeline._run_ticker_list(tickers, store_results=False, validate=validate)
+    finally:
+        engine.dispose()
+
+
+# Default-constructed pipelines, keyed by id(engine). Engines are long-lived
+# (src.db.engine shares one per process), so the cache stays tiny.
+_PIPELINE_CACHE: Dict[int, MertonPipeline] = {}
+
+
+def _get_cached_pipeline(engine) -> MertonPipeline:
+    """Return the default MertonPipeline for engine, building it on first use."""
+    pipeline = _PIPELINE_CACHE.get(id(engine))
+    # Guard against id() reuse after an engine has been garbage collected
+    if pipeline is None or pipeline.engine is not engine:
+        pipeline = MertonPipeline(engine)
+        _PIPELINE_CACHE[id(engine)] = pipeline
+    return pipeline
+
 
 # Convenience function
 def run_merton_pipeline(
@@ -340,6 +733,9 @@ def run_merton_pipeline(
     """
     Run Merton pipeline for a single ticker.
 
+    The pipeline (config + solver) is built once per engine and reused, so
+    calling this in a loop over tickers doesn't pay the setup cost each time.
+
     Args:
         ticker: Stock ticker
         engine: Database engine
@@ -348,5 +744,8 @@ def run_merton_pipeline(
     Returns:
         DataFrame with Merton outputs
     """
-    pipeline = MertonPipeline(engine)
-    return pipeline.run_for_ticker(ticker, store_results=store_results)
\ No newline at end of file
+    pipeline = _get_cached_pipeline(engine)
+    return pipeline.run_for_ticker(ticker, store_results=store_results)
+
+
+run_merton_pipeline.cache_clear = _PIPELINE_CACHE.clear
@@ -13,7 +13,7 @@ Analyzes how PD changes with variations in:
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 try:
     from src.merton.solver import MertonSolver
@@ -50,7 +50,8 @@ class SensitivityAnalyzer:
             param_name: str,
             param_values: np.ndarray,
             base_params: Dict,
-            use_real_world: bool = False
+            use_real_world: bool = False,
+            initial_guess: Optional[Tuple[float, float]] = None
     ) -> pd.DataFrame:
         """
         Analyze sensitivity to a single parameter.
@@ -60,74 +61,99 @@ class SensitivityAnalyzer:
             param_values: Array of values to test
             base_params: Dict with base values for all parameters
             use_real_world: Use real-world DD/PD (requires 'mu' in base_params)
+            initial_guess: Optional (V, σ_V) solution at base_params, used to
+                warm-start every point of the sweep
 
         Returns:
             DataFrame with parameter values and resulting metrics
         """
-        results = []
-
-        for value in param_values:
-            # Set current parameter value
-            current_params = base_params.copy()
-            current_params[param_name] = value
-
-            # Solve Merton model
-            result = self.solver.solve(
-                E=current_params['E'],
-                sigma_E=current_params['sigma_E'],
-                D=current_params['D'],
-                r=current_params['r'],
-                T=current_params['T']
-            )
+        return pd.DataFrame(self.analyze_parameter_arrays(
+            param_name,
+            param_values,
+            base_params,
+            use_real_world=use_real_world,
+            initial_guess=initial_guess
+        ))
+
+    def analyze_parameter_arrays(
+            self,
+            param_name: str,
+            param_values: np.ndarray,
+            base_params: Dict,
+            use_real_world: bool = False,
+            initial_guess: Optional[Tuple[float, float]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Array version of analyze_parameter, without building a DataFrame.
+
+        Useful for plotting or optimisation loops that only need a couple
+        of the metric arrays. Arguments are as for analyze_parameter.
 
-            if not result['converged']:
-                results.append({
-                    param_name: value,
-                    'V': np.nan,
-                    'sigma_V': np.nan,
-                    'DD': np.nan,
-                    'PD': np.nan,
-                    'converged': False
-                })
-                continue
-
-            # Calculate DD and PD
-            if use_real_world and 'mu' in current_params:
-                DD = calculate_dd_real_world(
-                    result['V'],
-                    current_params['D'],
-                    result['sigma_V'],
-                    current_params['mu'],
-                    current_params['T']
-                )
-            else:
-                DD = calculate_dd_risk_neutral(
-                    result['V'],
-                    current_params['D'],
-                    result['sigma_V'],
-                    current_params['r'],
-                    current_params['T']
-                )
-
-            PD = calculate_pd_from_dd(DD)
-
-            results.append({
-                param_name: value,
-                'V': result['V'],
-                'sigma_V': result['sigma_V'],
-                'DD': DD,
-                'PD': PD,
-                'leverage': current_params['D'] / result['V'],
-                'converged': True
-            })
-
-        return pd.DataFrame(results)
+        Returns:
+            Dict of equal-length arrays keyed by param_name, 'V', 'sigma_V',
+            'DD', 'PD', 'leverage' and 'converged'
+        """
+        param_values = np.asarray(param_values, dtype=float)
+
+        # Base parameters broadcast across the sweep, param_name overridden
+        params = {
+            key: np.full(len(param_values), base_params[key], dtype=float)
+            for key in ('E', 'sigma_E', 'D', 'r', 'T')
+        }
+        params[param_name] = param_values
+
+        # Warm start: shift the base solution by the change in E and in
+        # discounted D, and scale σ_V with σ_E (fixed leverage)
+        V0 = sigma_V0 = None
+        if initial_guess is not None:
+            V_base, sigma_V_base = initial_guess
+            V0 = (
+                V_base
+                + (params['E'] - base_params['E'])
+                + (params['D'] - base_params['D']) * np.exp(-params['r'] * params['T'])
+            )
+            sigma_V0 = sigma_V_base * params['sigma_E'] / base_params['sigma_E']
+
+        # Solve every value at once with the vectorized Newton solver (it
+        # falls back to scalar fsolve for any point it can't settle)
+        solved = self.solver.solve_batch(
+            params['E'], params['sigma_E'], params['D'], params['r'], params['T'],
+            V0=V0, sigma_V0=sigma_V0
+        )
+
+        converged = solved['converged']
+        V = solved['V']
+        sigma_V = solved['sigma_V']
+        D = params['D']
+        T = params['T']
+
+        # Calculate DD and PD on the whole sweep
+        if use_real_world and 'mu' in base_params:
+            mu = param_values if param_name == 'mu' else base_params['mu']
+            DD = calculate_dd_real_world(V, D, sigma_V, mu, T)
+        else:
+            DD = calculate_dd_risk_neutral(V, D, sigma_V, params['r'], T)
+
+        PD = calculate_pd_from_dd(DD)
+
+        # solve_batch returns NaN V/σ_V for non-converged points, which
+        # carries through DD, PD and leverage, so no masking pass is needed
+        return {
+            param_name: param_values,
+            'V': V,
+            'sigma_V': sigma_V,
+            'DD': DD,
+            'PD': PD,
+            'leverage': D / V,
+            'converged': converged
+        }
 
     def analyze_volatility_sensitivity(
             self,
             base_params: Dict,
             vol_range: tuple[float, float] = (0.1, 1.0),
-            n_points: int = 20
+            n_points: int = 20,
+            initial_guess: Optional[Tuple[float, float]] = None
     ) -> pd.DataFrame:
         """
         Analyze sensitivity to equity volatility.
@@ -136,18 +162,22 @@ class SensitivityAnalyzer:
             base_params: Base parameter values
             vol_range: (min, max) volatility range to test
             n_points: Number of points to test
+            initial_guess: Optional (V, σ_V) base solution for warm starts
 
         Returns:
             DataFrame with volatility vs PD
         """
         vol_values = np.linspace(vol_range[0], vol_range[1], n_points)
 
-        return self.analyze_parameter('sigma_E', vol_values, base_params)
+        return self.analyze_parameter(
+            'sigma_E', vol_values, base_params, initial_guess=initial_guess
+        )
 
     def analyze_debt_sensitivity(
             self,
             base_params: Dict,
-            debt_changes: np.ndarray = None
+            debt_changes: np.ndarray = None,
+            initial_guess: Optional[Tuple[float, float]] = None
     ) -> pd.DataFrame:
         """
         Analyze sensitivity to debt level.
@@ -156,6 +186,7 @@ class SensitivityAnalyzer:
             base_params: Base parameter values
             debt_changes: Array of percentage changes (e.g., [-0.2, -0.1, 0, 0.1, 0.2])
                          Default: -50% to +50% in 10% increments
+            initial_guess: Optional (V, σ_V) base solution for warm starts
 
         Returns:
             DataFrame with debt level vs PD
@@ -166,7 +197,9 @@ class SensitivityAnalyzer:
         base_debt = base_params['D']
         debt_values = base_debt * (1 + debt_changes)
 
-        results = self.analyze_parameter('D', debt_values, base_params)
+        results = self.analyze_parameter(
+            'D', debt_values, base_params, initial_guess=initial_guess
+        )
         results['debt_change_pct'] = debt_changes * 100
 
         return results
@@ -175,7 +208,8 @@ class SensitivityAnalyzer:
             self,
             base_params: Dict,
             rate_range: tuple[float, float] = (0.01, 0.1),
-            n_points: int = 20
+            n_points: int = 20,
+            initial_guess: Optional[Tuple[float, float]] = None
     ) -> pd.DataFrame:
         """
         Analyze sensitivity to risk-free rate.
@@ -184,13 +218,16 @@ class SensitivityAnalyzer:
             base_params: Base parameter values
             rate_range: (min, max) rate range to test
             n_points: Number of points to test
+            initial_guess: Optional (V, σ_V) base solution for warm starts
 
         Returns:
             DataFrame with rate vs PD
         """
         rate_values = np.linspace(rate_range[0], rate_range[1], n_points)
 
-        return self.analyze_parameter('r', rate_values, base_params)
+        return self.analyze_parameter(
+            'r', rate_values, base_params, initial_guess=initial_guess
+        )
 
     def run_comprehensive_analysis(
             self,
@@ -209,17 +246,33 @@ class SensitivityAnalyzer:
         """
         results = {}
 
+        # Solve the base case once; every sweep starts from its solution
+        base = self.solver.solve(
+            E=base_params['E'],
+            sigma_E=base_params['sigma_E'],
+            D=base_params['D'],
+            r=base_params['r'],
+            T=base_params['T']
+        )
+        initial_guess = (base['V'], base['sigma_V']) if base['converged'] else None
+
         # Volatility sensitivity
         print("Analyzing volatility sensitivity...")
-        results['volatility'] = self.analyze_volatility_sensitivity(base_params)
+        results['volatility'] = self.analyze_volatility_sensitivity(
+            base_params, initial_guess=initial_guess
+        )
 
         # Debt sensitivity
         print("Analyzing debt sensitivity...")
-        results['debt'] = self.analyze_debt_sensitivity(base_params)
+        results['debt'] = self.analyze_debt_sensitivity(
+            base_params, initial_guess=initial_guess
+        )
 
         # Rate sensitivity
         print("Analyzing rate sensitivity...")
-        results['rate'] = self.analyze_rate_sensitivity(base_params)
+        results['rate'] = self.analyze_rate_sensitivity(
+            base_params, initial_guess=initial_guess
+        )
 
         return results
 
@@ -240,10 +293,10 @@ def run_sensitivity_analysis(
     Returns:
         Dictionary with sensitivity results
     """
-    from features.merton_inputs import build_merton_inputs
+    from features.merton_inputs import build_merton_inputs_cached
 
     # Load Merton inputs
-    inputs = build_merton_inputs(ticker, engine)
+    inputs = build_merton_inputs_cached(ticker, engine)
 
     if inputs.empty:
         raise ValueError(f"No Merton inputs found for {ticker}")
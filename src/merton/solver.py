@@ -3,7 +3,8 @@ src/merton/solver.py
 
 Merton model solver for asset value and volatility estimation.
 
-Based on KMV approach using scipy.optimize.fsolve to solve the system:
+Based on KMV approach, solving the system with a damped Newton iteration
+(scipy.optimize.fsolve as fallback):
     E = V·N(d1) - D·exp(-rT)·N(d2)
     σ_E = (V/E)·N(d1)·σ_V
 
@@ -17,27 +18,267 @@ where:
     T = Time to maturity
 """
 
+import contextlib
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+
 import numpy as np
 import pandas as pd
 import warnings
-from typing import Tuple, Optional, Dict
+from scipy.special import ndtr
+from typing import Tuple, Optional, Dict, Union
 
-# Scipy imports with error handling
-try:
-    from scipy.stats import norm
+ArrayLike = Union[float, np.ndarray]
+
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+# Minimum rows per thread before solve_dataframe(n_jobs > 1) splits the work
+PARALLEL_MIN_ROWS = 50_000
+
+# Iteration cap for the scalar Newton path before falling back to fsolve
+SCALAR_NEWTON_MAX_ITER = 100
+
+# Result of a failed solve, less the error message
+_FAIL_TEMPLATE = {
+    'V': np.nan,
+    'sigma_V': np.nan,
+    'd1': np.nan,
+    'd2': np.nan,
+    'converged': False,
+    'iterations': 0,
+    'method': None,
+    'error': None
+}
+
+
+@cache
+def _get_fsolve():
+    """
+    Import scipy.optimize.fsolve on first use.
+
+    scipy.optimize is the slowest import in this module and only the
+    Newton fallback needs it, so it stays out of the import path.
+    """
     from scipy.optimize import fsolve
-except ImportError as e:
-    raise ImportError(
-        "scipy is required for Merton solver. Install with: pip install scipy"
-    ) from e
+    return fsolve
+
+# Numba is optional: with it the fsolve residual is compiled to machine code,
+# without it the same function runs as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+_TINY = np.finfo(np.float64).tiny
+_INV_SQRT_2PI_F = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+@njit(inline='always', cache=True)
+def _ndtr(x):
+    """
+    Standard normal CDF for scalars, usable inside njit code.
+
+    Same as scipy.special.ndtr, which numba cannot call. The erfc form
+    keeps full relative precision in the lower tail, where
+    0.5 * (1 + erf(x/√2)) would cancel to 0.
+    """
+    return 0.5 * math.erfc(-x * _INV_SQRT_2)
+
+
+def _kernel_args(E, sigma_E, D, r, T):
+    """
+    Per-observation constants for the scalar kernels.
+
+    rT, √T and D·exp(-rT) don't depend on (V, σ_V), so they are computed
+    once per solve rather than on every residual/Jacobian evaluation.
+
+    Returns:
+        (E, sigma_E, D, rT, T, sqrt_T, disc_D)
+    """
+    rT = r * T
+    return E, sigma_E, D, rT, T, math.sqrt(T), D * math.exp(-rT)
+
+
+@njit(cache=True)
+def _merton_residuals(V, sigma_V, E, sigma_E, D, rT, T, sqrt_T, disc_D):
+    """
+    Residuals of the two KMV equations at (V, σ_V) for scalar inputs.
+
+    Scalar math-module code only, so it compiles under numba.njit. The
+    trailing arguments come from _kernel_args.
+
+    Returns:
+        (eq1, eq2); (1e9, 1e9) outside V > D > 0, σ_V > 0
+    """
+    # Straight-line evaluation: residuals are computed on safe stand-ins and
+    # the penalty is selected afterwards, instead of branching out early.
+    # D = 0 becomes a tiny positive D, which sends d1, d2 to +inf as it should.
+    bad = (V <= 0.0) | (sigma_V <= 0.0) | (V <= D)
+    D_safe = max(D, _TINY)
+    V_safe = V if V > D_safe else 2.0 * D_safe
+    sigma_safe = sigma_V if sigma_V > 0.0 else 1.0
+
+    vol = sigma_safe * sqrt_T
+    d1 = (math.log(V_safe / D_safe) + rT + 0.5 * sigma_safe**2 * T) / vol
+    d2 = d1 - vol
+    Nd1 = _ndtr(d1)
+    Nd2 = _ndtr(d2)
+
+    # Equation 1: E = V·N(d1) - D·exp(-rT)·N(d2)
+    eq1 = V_safe * Nd1 - disc_D * Nd2 - E
+
+    # Equation 2: σ_E = (V/E)·N(d1)·σ_V
+    eq2 = (V_safe / E) * Nd1 * sigma_safe - sigma_E
+
+    # Guard against invalid values and log(0) / log(negative)
+    eq1 = 1e9 if bad else eq1
+    eq2 = 1e9 if bad else eq2
+
+    return eq1, eq2
+
+
+@njit(cache=True)
+def _merton_jacobian(V, sigma_V, E, sigma_E, D, rT, T, sqrt_T, disc_D):
+    """
+    Analytic Jacobian of _merton_residuals with respect to (V, σ_V).
+
+    With n(x) the standard normal density:
+        ∂eq1/∂V = N(d1)                      ∂eq1/∂σ_V = V·n(d1)·√T
+        ∂eq2/∂V = σ_V·(N(d1) + n(d1)/(σ_V√T))/E
+        ∂eq2/∂σ_V = V·(N(d1) - n(d1)·d2)/E
+
+    Evaluated on the same safe stand-ins as the residuals, so it stays
+    finite (if uninformative) outside V > D, σ_V > 0.
+
+    Returns:
+        ((∂eq1/∂V, ∂eq1/∂σ_V), (∂eq2/∂V, ∂eq2/∂σ_V))
+    """
+    D_safe = max(D, _TINY)
+    V_safe = V if V > D_safe else 2.0 * D_safe
+    sigma_safe = sigma_V if sigma_V > 0.0 else 1.0
+
+    vol = sigma_safe * sqrt_T
+    d1 = (math.log(V_safe / D_safe) + rT + 0.5 * sigma_safe**2 * T) / vol
+    d2 = d1 - vol
+    Nd1 = _ndtr(d1)
+    # n(±inf) = 0 (D = 0); avoid inf * 0 below
+    nd1 = _INV_SQRT_2PI_F * math.exp(-0.5 * d1 * d1) if abs(d1) < 1e150 else 0.0
+    nd1_d2 = nd1 * d2 if nd1 > 0.0 else 0.0
+
+    j11 = Nd1
+    j12 = V_safe * nd1 * sqrt_T
+    j21 = sigma_safe * (Nd1 + nd1 / vol) / E
+    j22 = V_safe * (Nd1 - nd1_d2) / E
+
+    return (j11, j12), (j21, j22)
+
+
+@njit(cache=True)
+def _solve_merton_scalar(V0, sigma_V0, E, sigma_E, D, rT, T, sqrt_T, disc_D,
+                         max_iter, tol):
+    """
+    Damped Newton on the 2×2 KMV system with the analytic Jacobian.
+
+    Runs entirely inside one compiled call under numba (no Python callback
+    per evaluation as with fsolve). Each Newton step is backtracked until it
+    stays in V > D, σ_V > 0 and reduces the residual norm, with the first
+    equation scaled by E so both residuals are O(1). The trailing kernel
+    arguments come from _kernel_args.
+
+    Returns:
+        (V, sigma_V, converged, nfev)
+    """
+    V = V0
+    sigma_V = sigma_V0
+    f1, f2 = _merton_residuals(V, sigma_V, E, sigma_E, D, rT, T, sqrt_T, disc_D)
+    f1 /= E
+    norm = f1 * f1 + f2 * f2
+    nfev = 1
+
+    for _ in range(max_iter):
+        (j11, j12), (j21, j22) = _merton_jacobian(
+            V, sigma_V, E, sigma_E, D, rT, T, sqrt_T, disc_D
+        )
+        j11 /= E
+        j12 /= E
+        det = j11 * j22 - j12 * j21
+        if det == 0.0 or not math.isfinite(det):
+            break
+        dV = (j22 * f1 - j12 * f2) / det
+        ds = (j11 * f2 - j21 * f1) / det
+
+        # Converged once the Newton step is negligible
+        if abs(dV) <= tol * V and abs(ds) <= tol * sigma_V:
+            return V, sigma_V, True, nfev
+
+        # Backtracking line search on the residual norm
+        alpha = 1.0
+        accepted = False
+        for _ in range(30):
+            V_new = V - alpha * dV
+            s_new = sigma_V - alpha * ds
+            if V_new > D and s_new > 0.0:
+                g1, g2 = _merton_residuals(
+                    V_new, s_new, E, sigma_E, D, rT, T, sqrt_T, disc_D
+                )
+                nfev += 1
+                g1 /= E
+                new_norm = g1 * g1 + g2 * g2
+                if new_norm < norm or (alpha == 1.0 and new_norm == norm):
+                    accepted = True
+                    break
+            alpha *= 0.5
+
+        if not accepted:
+            break
+
+        V, sigma_V = V_new, s_new
+        f1, f2, norm = g1, g2, new_norm
+        if norm == 0.0:
+            return V, sigma_V, True, nfev
+
+    return V, sigma_V, False, nfev
+
+
+def _get_array_module(device: str = 'cpu'):
+    """
+    Return (array module, ndtr) for the requested device.
+
+    'cuda' uses CuPy when it is installed; otherwise (or for 'cpu') numpy
+    and scipy.special.ndtr are returned.
+    """
+    if device == 'cuda':
+        try:
+            import cupy
+            from cupyx.scipy.special import ndtr as cupy_ndtr
+            return cupy, cupy_ndtr
+        except ImportError:
+            warnings.warn("CuPy is not installed; running on CPU instead")
+
+    return np, ndtr
+
+
+def _to_host(x):
+    """Copy a CuPy array back to numpy (numpy arrays pass through)."""
+    return x.get() if hasattr(x, 'get') else x
 
 
 class MertonSolver:
     """
     Solve Merton structural credit model for asset value and volatility.
 
-    Uses simultaneous equation solver (fsolve) to find V and σ_V that satisfy
-    both the equity value equation and the volatility relationship.
+    Uses a damped Newton iteration (falling back to fsolve) to find V and σ_V
+    that satisfy both the equity value equation and the volatility relationship.
     """
 
     def __init__(
@@ -46,7 +287,9 @@ class MertonSolver:
             tolerance: float = 1e-12,
             min_sigma: float = 1e-4,
             max_sigma: float = 3.0,
-            initial_guess_method: str = 'scaled'
+            initial_guess_method: str = 'kmv',
+            analytic_jacobian: bool = False,
+            method: str = 'newton'
     ):
         """
         Initialize Merton solver.
@@ -57,16 +300,28 @@ class MertonSolver:
             min_sigma: Minimum allowed asset volatility
             max_sigma: Maximum allowed asset volatility (sanity check)
             initial_guess_method: Method for initial guess
-                - 'scaled': σ_V = σ_E × (E/V) [most robust]
+                - 'kmv': V = E + D·exp(-rT), σ_V = σ_E × (E/V) [closest start]
+                - 'scaled': V = E + D, σ_V = σ_E × (E/V) [most robust]
                 - 'half': σ_V = σ_E × 0.5 [conservative]
                 - 'fixed': σ_V = 0.2 [simple default]
                 - 'custom': Provide custom guess in solve() call
+            analytic_jacobian: Pass the closed-form Jacobian to fsolve
+                (hybrj) instead of letting it finite-difference (hybrd).
+                Fewer residual evaluations, but hybrj gives up slightly
+                more often at the default 1e-12 tolerance, so it is off
+                by default.
+            method: Scalar solve strategy
+                - 'newton': compiled damped Newton with the analytic
+                  Jacobian, falling back to fsolve if it does not converge
+                - 'fsolve': MINPACK only
         """
         self.max_iter = max_iter
         self.tolerance = tolerance
         self.min_sigma = min_sigma
         self.max_sigma = max_sigma
         self.initial_guess_method = initial_guess_method
+        self.analytic_jacobian = analytic_jacobian
+        self.method = method
 
     def solve(
             self,
@@ -96,6 +351,7 @@ class MertonSolver:
                 - d2: Black-Scholes d2
                 - converged: Whether solver converged
                 - iterations: Number of iterations (approximate)
+                - method: 'newton' or 'fsolve', whichever converged
         """
 
         # Input validation
@@ -108,47 +364,49 @@ class MertonSolver:
         if T <= 0:
             return self._failed_result("Time to maturity (T) must be positive")
 
-        # Define the system of equations
-        def equations(x):
-            V, sigma_V = x
-
-            # Guard against invalid values
-            if V <= 0 or sigma_V <= 0:
-                return [1e9, 1e9]
-
-            # Guard against log(0) or log(negative)
-            if V <= D:
-                return [1e9, 1e9]
-
-            # Calculate d1 and d2
-            try:
-                sqrt_T = np.sqrt(T)
-                d1 = (np.log(V / D) + (r + 0.5 * sigma_V ** 2) * T) / (sigma_V * sqrt_T)
-                d2 = d1 - sigma_V * sqrt_T
-            except (ValueError, ZeroDivisionError):
-                return [1e9, 1e9]
-
-            # Equation 1: E = V·N(d1) - D·exp(-rT)·N(d2)
-            eq1 = V * norm.cdf(d1) - np.exp(-r * T) * D * norm.cdf(d2) - E
+        # System of equations; the residual itself is module-level (and
+        # numba-compiled when available) so fsolve's callback stays cheap
+        kernel_args = _kernel_args(E, sigma_E, D, r, T)
 
-            # Equation 2: σ_E = (V/E)·N(d1)·σ_V
-            eq2 = (V / E) * norm.cdf(d1) * sigma_V - sigma_E
+        def equations(x):
+            return _merton_residuals(x[0], x[1], *kernel_args)
 
-            return [eq1, eq2]
+        # Optional analytic Jacobian in place of fsolve's finite differences
+        jacobian = None
+        if self.analytic_jacobian:
+            def jacobian(x):
+                return _merton_jacobian(x[0], x[1], *kernel_args)
 
         # Set initial guess using specified method
         if initial_guess is None:
             V_0 = E + D
+            if self.initial_guess_method == 'kmv':
+                # Equity plus the present value of debt, when that clears D
+                V_pv = E + D * math.exp(-r * T)
+                if V_pv > D:
+                    V_0 = V_pv
             sigma_V_0 = self._compute_initial_sigma_guess(E, D, sigma_E, V_0)
             initial_guess = [V_0, sigma_V_0]
 
         # Solve the system
         try:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                solution = fsolve(
+            newton_nfev = 0
+            if self.method == 'newton':
+                V, sigma_V, converged, newton_nfev = _solve_merton_scalar(
+                    float(initial_guess[0]), float(initial_guess[1]), *kernel_args,
+                    SCALAR_NEWTON_MAX_ITER, self.tolerance
+                )
+                if converged:
+                    return self._solution_result(V, sigma_V, D, r, T, newton_nfev, 'newton')
+
+            # fsolve only reports through its return value with full_output,
+            # so the numpy floating-point flags are all that need silencing
+            # (a C-level toggle, unlike catch_warnings' filter-list copy)
+            with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+                solution = _get_fsolve()(
                     equations,
                     initial_guess,
+                    fprime=jacobian,
                     xtol=self.tolerance,
                     maxfev=self.max_iter,
                     full_output=True
@@ -164,31 +422,283 @@ class MertonSolver:
             if not converged:
                 return self._failed_result(f"Solver did not converge: {msg}")
 
-            if V <= 0 or V <= D:
-                return self._failed_result(f"Invalid V={V:.2f} (must be > D={D:.2f})")
+            return self._solution_result(
+                V, sigma_V, D, r, T, newton_nfev + info['nfev'], 'fsolve'
+            )
 
-            if sigma_V < self.min_sigma or sigma_V > self.max_sigma:
-                return self._failed_result(
-                    f"Invalid sigma_V={sigma_V:.4f} (range: {self.min_sigma}-{self.max_sigma})"
-                )
+        except Exception as e:
+            return self._failed_result(f"Solver exception: {str(e)}")
+
+    def _solution_result(
+            self,
+            V: float,
+            sigma_V: float,
+            D: float,
+            r: float,
+            T: float,
+            nfev: int,
+            method: str
+    ) -> Dict[str, float]:
+        """Validate a converged (V, σ_V) and build the result dictionary."""
+        if V <= 0 or V <= D:
+            return self._failed_result(f"Invalid V={V:.2f} (must be > D={D:.2f})")
+
+        if sigma_V < self.min_sigma or sigma_V > self.max_sigma:
+            return self._failed_result(
+                f"Invalid sigma_V={sigma_V:.4f} (range: {self.min_sigma}-{self.max_sigma})"
+            )
+
+        # Calculate d1, d2
+        sqrt_T = np.sqrt(T)
+        d1 = (np.log(V / D) + (r + 0.5 * sigma_V ** 2) * T) / (sigma_V * sqrt_T)
+        d2 = d1 - sigma_V * sqrt_T
+
+        return {
+            'V': V,
+            'sigma_V': sigma_V,
+            'd1': d1,
+            'd2': d2,
+            'converged': True,
+            'iterations': nfev,
+            'method': method,
+            'error': None
+        }
+
+    def solve_batch(
+            self,
+            E: ArrayLike,
+            sigma_E: ArrayLike,
+            D: ArrayLike,
+            r: ArrayLike,
+            T: ArrayLike,
+            V0: Optional[ArrayLike] = None,
+            sigma_V0: Optional[ArrayLike] = None,
+            max_newton_iter: int = 50,
+            device: str = 'cpu',
+            groups: Optional[np.ndarray] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Solve many Merton systems at once with a vectorized Newton iteration.
+
+        All inputs are broadcast to a common shape and every observation is
+        iterated simultaneously using the analytic Jacobian, so the Python
+        loop runs over iterations rather than observations. Observations the
+        Newton pass does not settle are retried with the scalar fsolve path,
+        so convergence is never worse than calling solve() per observation.
+
+        Args:
+            E: Equity value(s)
+            sigma_E: Equity volatility(ies)
+            D: Debt / default point(s)
+            r: Risk-free rate(s)
+            T: Time(s) to maturity
+            V0: Optional starting asset value(s) (default: E + D)
+            sigma_V0: Optional starting asset volatility(ies)
+                (default: initial_guess_method); rows where V0 or sigma_V0
+                is NaN use the defaults
+            max_newton_iter: Maximum vectorized Newton iterations
+            device: 'cpu', or 'cuda' to run the Newton iteration on the GPU
+                with CuPy (falls back to CPU if CuPy is unavailable)
+            groups: Optional group labels (e.g. ticker); fsolve retries are
+                warm-started only from earlier rows of the same group
 
-            # Calculate d1, d2
-            sqrt_T = np.sqrt(T)
+        Returns:
+            Dictionary of (host numpy) arrays: V, sigma_V, d1, d2, converged,
+            iterations (Newton steps, or fsolve evaluations for retried
+            rows), method ('newton'/'fsolve', None if unsolved) and error
+            (None, or the failure message)
+        """
+        E, sigma_E, D, r, T = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (E, sigma_E, D, r, T))
+        )
+        shape = E.shape
+        E, sigma_E, D, r, T = (x.ravel() for x in (E, sigma_E, D, r, T))
+        n = E.size
+
+        valid = (E > 0) & (sigma_E > 0) & (D > 0) & (T > 0)
+
+        # Starting point, same defaults as solve(); rows whose V0/σ_V0 guess
+        # is missing (NaN) also fall back to the defaults
+        V = E + D
+        if self.initial_guess_method == 'kmv':
+            V_pv = E + D * np.exp(-r * T)
+            V = np.where(V_pv > D, V_pv, V)
+        if self.initial_guess_method == 'half':
+            sigma_V = sigma_E * 0.5
+        elif self.initial_guess_method == 'fixed':
+            sigma_V = np.full(n, 0.2)
+        else:
+            sigma_V = sigma_E * (E / V)
+
+        if V0 is not None or sigma_V0 is not None:
+            V_guess = V if V0 is None else np.broadcast_to(
+                np.asarray(V0, dtype=np.float64), shape).ravel()
+            sigma_guess = sigma_V if sigma_V0 is None else np.broadcast_to(
+                np.asarray(sigma_V0, dtype=np.float64), shape).ravel()
+            has_guess = np.isfinite(V_guess) & np.isfinite(sigma_guess)
+            V = np.where(has_guess, V_guess, V)
+            sigma_V = np.where(has_guess, sigma_guess, sigma_V)
+        sigma_V = np.clip(sigma_V, self.min_sigma, self.max_sigma)
+
+        # Rows to iterate
+        active = valid & (V > D) & (sigma_V > 0)
+
+        V, sigma_V, settled, iterations = self._newton_batch(
+            E, sigma_E, D, r, T, V, sigma_V, active, max_newton_iter, device
+        )
+
+        ok = settled & (V > D) & (sigma_V >= self.min_sigma) & (sigma_V <= self.max_sigma)
+        error = np.full(n, None, dtype=object)
+        method = np.where(ok, 'newton', None).astype(object)
+
+        # Retry anything the vectorized pass missed with the scalar solver
+        # (which also reports why invalid inputs fail). Each retry starts
+        # from the nearest earlier solved row in the same group, which for a
+        # time series is usually a day away, before trying the cold guess.
+        if groups is not None:
+            groups = np.broadcast_to(np.asarray(groups), shape).ravel()
+        batch_ok = np.flatnonzero(ok)
+        last_retry_ok = -1
+
+        for i in np.flatnonzero(~ok):
+            pos = np.searchsorted(batch_ok, i)
+            j = max(batch_ok[pos - 1] if pos > 0 else -1, last_retry_ok)
+            result = None
+            if j >= 0 and (groups is None or groups[j] == groups[i]):
+                result = self.solve(
+                    E[i], sigma_E[i], D[i], r[i], T[i],
+                    initial_guess=(V[j], sigma_V[j])
+                )
+            if result is None or not result['converged']:
+                result = self.solve(E[i], sigma_E[i], D[i], r[i], T[i])
+            iterations[i] = result['iterations']
+            method[i] = result['method']
+            if result['converged']:
+                V[i], sigma_V[i] = result['V'], result['sigma_V']
+                ok[i] = True
+                last_retry_ok = i
+            else:
+                error[i] = result['error']
+
+        V = np.where(ok, V, np.nan)
+        sigma_V = np.where(ok, sigma_V, np.nan)
+
+        sqrt_T = np.sqrt(T)
+        with np.errstate(all='ignore'):
             d1 = (np.log(V / D) + (r + 0.5 * sigma_V ** 2) * T) / (sigma_V * sqrt_T)
-            d2 = d1 - sigma_V * sqrt_T
-
-            return {
-                'V': V,
-                'sigma_V': sigma_V,
-                'd1': d1,
-                'd2': d2,
-                'converged': True,
-                'iterations': info['nfev'],
-                'error': None
-            }
+        d2 = d1 - sigma_V * sqrt_T
 
-        except Exception as e:
-            return self._failed_result(f"Solver exception: {str(e)}")
+        return {
+            'V': V.reshape(shape),
+            'sigma_V': sigma_V.reshape(shape),
+            'd1': d1.reshape(shape),
+            'd2': d2.reshape(shape),
+            'converged': ok.reshape(shape),
+            'iterations': iterations.reshape(shape),
+            'method': method.reshape(shape),
+            'error': error.reshape(shape)
+        }
+
+    def _newton_batch(
+            self,
+            E: np.ndarray,
+            sigma_E: np.ndarray,
+            D: np.ndarray,
+            r: np.ndarray,
+            T: np.ndarray,
+            V: np.ndarray,
+            sigma_V: np.ndarray,
+            active: np.ndarray,
+            max_newton_iter: int,
+            device: str = 'cpu'
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Damped Newton iteration over flat arrays of Merton systems.
+
+        Args:
+            E, sigma_E, D, r, T: Flat input arrays
+            V, sigma_V: Starting points (flat arrays)
+            active: Mask of rows to iterate
+            max_newton_iter: Maximum iterations
+            device: 'cpu' or 'cuda'
+
+        Returns:
+            (V, sigma_V, settled, iterations) as host numpy arrays
+        """
+        xp, ndtr_fn = _get_array_module(device)
+
+        E, sigma_E, D, r, T, V, sigma_V, active = (
+            xp.asarray(x) for x in (E, sigma_E, D, r, T, V, sigma_V, active)
+        )
+        active = active.copy()
+        settled = xp.zeros(E.size, dtype=bool)
+        iterations = xp.zeros(E.size, dtype=np.int64)
+
+        sqrt_T = xp.sqrt(T)
+        disc_D = D * xp.exp(-r * T)
+
+        # CuPy does not raise floating-point warnings, so only numpy needs errstate
+        quiet = np.errstate(all='ignore') if xp is np else contextlib.nullcontext()
+
+        with quiet:
+            for _ in range(max_newton_iter):
+                if not active.any():
+                    break
+
+                idx = xp.flatnonzero(active)
+                Vi, si, Ei, Di, ri, Ti = V[idx], sigma_V[idx], E[idx], D[idx], r[idx], T[idx]
+                sTi = sqrt_T[idx]
+
+                d1 = (xp.log(Vi / Di) + (ri + 0.5 * si * si) * Ti) / (si * sTi)
+                d2 = d1 - si * sTi
+                Nd1 = ndtr_fn(d1)
+                nd1 = _INV_SQRT_2PI * xp.exp(-0.5 * d1 * d1)
+
+                # Residuals, both scaled by E
+                f1 = (Vi * Nd1 - disc_D[idx] * ndtr_fn(d2)) / Ei - 1.0
+                f2 = Vi * Nd1 * si / Ei - sigma_E[idx]
+
+                # Analytic Jacobian of (f1, f2) w.r.t. (V, σ_V)
+                j11 = Nd1 / Ei
+                j12 = Vi * nd1 * sTi / Ei
+                j21 = si * (Nd1 + nd1 / (si * sTi)) / Ei
+                j22 = Vi * (Nd1 - nd1 * d2) / Ei
+
+                det = j11 * j22 - j12 * j21
+                dV = (j22 * f1 - j12 * f2) / det
+                ds = (j11 * f2 - j21 * f1) / det
+
+                # Halve the step wherever it would leave V > D, σ_V > 0. The
+                # number of halvings comes from the largest feasible step
+                # (V - D)/dV, σ_V/dσ_V in closed form, so there is no
+                # data-dependent loop; one extra halving covers rounding.
+                limit = xp.minimum(
+                    xp.where(dV > 0, (Vi - Di) / dV, xp.inf),
+                    xp.where(ds > 0, si / ds, xp.inf)
+                )
+                halvings = xp.where(
+                    limit > 1.0, 0.0, xp.clip(xp.floor(-xp.log2(limit)) + 1.0, 0.0, 30.0)
+                )
+                alpha = xp.exp2(-halvings)
+                bad = (Vi - alpha * dV <= Di) | (si - alpha * ds <= 0)
+                alpha = xp.where(bad, 0.5 * alpha, alpha)
+
+                V_new = Vi - alpha * dV
+                s_new = si - alpha * ds
+                V[idx] = V_new
+                sigma_V[idx] = s_new
+                iterations[idx] += 1
+
+                # Converged once the full Newton step is negligible; a step
+                # that had to be damped away to nothing means Newton stalled
+                step = xp.maximum(xp.abs(dV) / V_new, xp.abs(ds) / s_new)
+                done = (step <= max(self.tolerance, 1e-13)) & (alpha == 1.0)
+                broken = ~xp.isfinite(step) | (alpha < 1e-6)
+
+                settled[idx[done]] = True
+                active[idx[done | broken]] = False
+
+        return _to_host(V), _to_host(sigma_V), _to_host(settled), _to_host(iterations)
 
     def _compute_initial_sigma_guess(self, E: float, D: float, sigma_E: float, V_0: float) -> float:
         """
@@ -198,12 +708,18 @@ class MertonSolver:
             E: Equity value
             D: Debt value
             sigma_E: Equity volatility
-            V_0: Initial guess for asset value (typically E + D)
+            V_0: Initial guess for asset value (E + D, or E + D·exp(-rT)
+                for 'kmv')
 
         Returns:
             Initial guess for asset volatility
         """
-        if self.initial_guess_method == 'scaled':
+        if self.initial_guess_method == 'kmv':
+            # Equity share of the (risk-adjusted) asset value: the KMV
+            # relation σ_V = σ_E·E/(V·N(d1)) with N(d1) ≈ 1
+            sigma_V_0 = sigma_E * (E / V_0)
+
+        elif self.initial_guess_method == 'scaled':
             # Scale by equity proportion: σ_V ≈ σ_E × (E/V)
             # Most robust for wide range of volatilities
             sigma_V_0 = sigma_E * (E / V_0)
@@ -229,15 +745,11 @@ class MertonSolver:
 
     def _failed_result(self, error_msg: str) -> Dict[str, float]:
         """Return failed result dictionary."""
-        return {
-            'V': np.nan,
-            'sigma_V': np.nan,
-            'd1': np.nan,
-            'd2': np.nan,
-            'converged': False,
-            'iterations': 0,
-            'error': error_msg
-        }
+        # Copy of a prebuilt template rather than seven fresh insertions;
+        # still a new dict, since callers may modify the result
+        result = _FAIL_TEMPLATE.copy()
+        result['error'] = error_msg
+        return result
 
     def solve_dataframe(
             self,
@@ -246,7 +758,10 @@ class MertonSolver:
             sigma_E_col: str = 'sigma_E',
             D_col: str = 'D',
             r_col: str = 'r',
-            T_col: str = 'T'
+            T_col: str = 'T',
+            warm_start_cols: Optional[Tuple[str, str]] = None,
+            group_col: Optional[str] = None,
+            n_jobs: int = 1
     ) -> pd.DataFrame:
         """
         Solve Merton model for entire DataFrame.
@@ -258,29 +773,81 @@ class MertonSolver:
             D_col: Column name for debt
             r_col: Column name for risk-free rate
             T_col: Column name for time to maturity
+            warm_start_cols: Optional (V_0, σ_V_0) column names with initial
+                guesses, e.g. a previous solution; rows where either is NaN
+                start from the default guess
+            group_col: Optional column (e.g. 'ticker') marking independent
+                series; rows needing an fsolve retry are warm-started from
+                the previous solved row only within the same group
+            n_jobs: Threads for large frames (-1 = all cores); frames under
+                PARALLEL_MIN_ROWS rows per thread are solved in one batch
 
         Returns:
-            DataFrame with added columns: V, sigma_V, d1, d2, converged
+            DataFrame with added columns: V, sigma_V, d1, d2, converged,
+            iterations, method ('newton'/'fsolve', None if unsolved), error
         """
-        results = []
-
-        for idx, row in df.iterrows():
-            result = self.solve(
-                E=row[E_col],
-                sigma_E=row[sigma_E_col],
-                D=row[D_col],
-                r=row[r_col],
-                T=row[T_col]
+        # Extract inputs as contiguous arrays once (SoA). float64 is kept on
+        # purpose: E and V are O(1e11) and the solver tolerance is 1e-12,
+        # well beyond float32.
+        E_arr, sigma_E_arr, D_arr, r_arr, T_arr = (
+            df[col].to_numpy(dtype=np.float64)
+            for col in (E_col, sigma_E_col, D_col, r_col, T_col)
+        )
+
+        V0 = sigma_V0 = None
+        if warm_start_cols is not None and all(col in df.columns for col in warm_start_cols):
+            V0, sigma_V0 = (df[col].to_numpy(dtype=np.float64) for col in warm_start_cols)
+
+        groups = df[group_col].to_numpy() if group_col is not None else None
+
+        # All rows at once with the vectorized Newton solver; rows it can't
+        # settle are retried with the scalar fsolve path inside solve_batch
+        n = len(df)
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        n_chunks = min(n_jobs, n // PARALLEL_MIN_ROWS)
+
+        if n_chunks <= 1:
+            solved = self.solve_batch(
+                E_arr, sigma_E_arr, D_arr, r_arr, T_arr,
+                V0=V0, sigma_V0=sigma_V0, groups=groups
             )
-            results.append(result)
-
-        # Convert results to DataFrame
-        results_df = pd.DataFrame(results)
-
-        # Combine with original DataFrame
-        output_df = pd.concat([df.reset_index(drop=True), results_df], axis=1)
+        else:
+            # Rows are independent, so contiguous chunks are solved in
+            # threads; numpy's ufuncs release the GIL during the Newton steps.
+            # Each chunk writes its slice of pre-allocated output arrays.
+            solved = {
+                'V': np.empty(n),
+                'sigma_V': np.empty(n),
+                'd1': np.empty(n),
+                'd2': np.empty(n),
+                'converged': np.empty(n, dtype=bool),
+                'iterations': np.empty(n, dtype=np.int64),
+                'method': np.empty(n, dtype=object),
+                'error': np.empty(n, dtype=object)
+            }
 
-        return output_df
+            def solve_chunk(rows):
+                pick = lambda x: None if x is None else x[rows]
+                part = self.solve_batch(
+                    E_arr[rows], sigma_E_arr[rows], D_arr[rows], r_arr[rows], T_arr[rows],
+                    V0=pick(V0), sigma_V0=pick(sigma_V0), groups=pick(groups)
+                )
+                for key, values in solved.items():
+                    values[rows] = part[key]
+
+            bounds = np.linspace(0, n, n_chunks + 1).astype(int)
+            with ThreadPoolExecutor(max_workers=n_chunks) as pool:
+                list(pool.map(
+                    solve_chunk, (slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:]))
+                ))
+
+        # Result arrays go straight onto the frame, with no intermediate
+        # results DataFrame or concat
+        return df.reset_index(drop=True).assign(**{
+            key: solved[key]
+            for key in ('V', 'sigma_V', 'd1', 'd2', 'converged', 'iterations', 'method', 'error')
+        })
 
 
 def solve_merton_single(
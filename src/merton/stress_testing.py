@@ -80,6 +80,54 @@ class StressScenario:
         return stressed
 
 
+# One record per scenario: the shocks of StressScenario as struct-of-arrays
+SHOCK_DTYPE = np.dtype([
+    ('equity', np.float64),
+    ('volatility', np.float64),
+    ('debt', np.float64),
+    ('rate', np.float64)
+])
+
+
+def scenario_shocks(scenarios: List[StressScenario]) -> np.ndarray:
+    """
+    Pack scenario shocks into a structured array.
+
+    Args:
+        scenarios: StressScenario objects
+
+    Returns:
+        Structured array (SHOCK_DTYPE), one element per scenario
+    """
+    return np.array(
+        [(s.equity_shock, s.volatility_shock, s.debt_shock, s.rate_shock) for s in scenarios],
+        dtype=SHOCK_DTYPE
+    )
+
+
+def apply_shocks(shocks: np.ndarray, base_params: Dict) -> Dict[str, np.ndarray]:
+    """
+    Apply many scenarios' shocks to base parameters at once.
+
+    Vectorized StressScenario.apply: the same shocks, broadcast over the
+    scenario axis.
+
+    Args:
+        shocks: Structured array from scenario_shocks
+        base_params: Dictionary with E, sigma_E, D, r, T
+
+    Returns:
+        Stressed parameters, one array per key (E, sigma_E, D, r, T)
+    """
+    return {
+        'E': base_params['E'] * (1 + shocks['equity']),
+        'sigma_E': base_params['sigma_E'] * shocks['volatility'],
+        'D': base_params['D'] * (1 + shocks['debt']),
+        'r': base_params['r'] + shocks['rate'],
+        'T': np.full(shocks.size, base_params['T'], dtype=float)
+    }
+
+
 class StressTester:
     """
     Stress testing framework for Merton model.
@@ -138,23 +186,55 @@ class StressTester:
         """
         self.solver = solver if solver is not None else MertonSolver()
 
-    def test_scenario(
+    def select_scenarios(self, scenarios: Optional[List[str]] = None) -> List[StressScenario]:
+        """
+        Look up historical scenarios by name, skipping unknown names.
+
+        Args:
+            scenarios: List of scenario names (default: all historical)
+
+        Returns:
+            StressScenario objects in the requested order
+        """
+        if scenarios is None:
+            return list(self.HISTORICAL_SCENARIOS.values())
+
+        selected = []
+        for scenario_name in scenarios:
+            if scenario_name not in self.HISTORICAL_SCENARIOS:
+                print(f"Warning: Unknown scenario '{scenario_name}', skipping")
+                continue
+            selected.append(self.HISTORICAL_SCENARIOS[scenario_name])
+        return selected
+
+    def apply_all(
             self,
-            scenario: StressScenario,
-            base_params: Dict
-    ) -> Dict:
+            base_params: Dict,
+            scenarios: Optional[List[str]] = None
+    ) -> Dict[str, np.ndarray]:
         """
-        Test a single stress scenario.
+        Stressed parameters for several scenarios as arrays.
 
         Args:
-            scenario: StressScenario to apply
             base_params: Base parameter values
+            scenarios: List of scenario names (default: all historical)
 
         Returns:
-            Dictionary with base and stressed results
+            Dictionary of E, sigma_E, D, r, T arrays, one element per scenario
+        """
+        return apply_shocks(scenario_shocks(self.select_scenarios(scenarios)), base_params)
+
+    def solve_base(self, base_params: Dict) -> Dict:
+        """
+        Solve the unstressed case once, for reuse across scenarios.
+
+        Args:
+            base_params: Base parameter values
+
+        Returns:
+            Solver result dictionary (see MertonSolver.solve)
         """
-        # Solve for base case
-        base_result = self.solver.solve(
+        return self.solver.solve(
             E=base_params['E'],
             sigma_E=base_params['sigma_E'],
             D=base_params['D'],
@@ -162,6 +242,28 @@ class StressTester:
             T=base_params['T']
         )
 
+    def test_scenario(
+            self,
+            scenario: StressScenario,
+            base_params: Dict,
+            base_result: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Test a single stress scenario.
+
+        Args:
+            scenario: StressScenario to apply
+            base_params: Base parameter values
+            base_result: Optional solve_base(base_params) result; solved
+                here if not given
+
+        Returns:
+            Dictionary with base and stressed results
+        """
+        # Solve for base case (unless the caller already has)
+        if base_result is None:
+            base_result = self.solve_base(base_params)
+
         if base_result['converged']:
             base_DD = calculate_dd_risk_neutral(
                 base_result['V'],
@@ -200,31 +302,12 @@ class StressTester:
             stressed_DD = np.nan
             stressed_PD = np.nan
 
-        # Calculate changes
-        DD_change = stressed_DD - base_DD if not np.isnan(stressed_DD) else np.nan
-        PD_change = stressed_PD - base_PD if not np.isnan(stressed_PD) else np.nan
-
-        return {
-            'scenario_name': scenario.name,
-            'scenario_description': scenario.description,
-            # Base case
-            'base_V': base_result['V'],
-            'base_sigma_V': base_result['sigma_V'],
-            'base_DD': base_DD,
-            'base_PD': base_PD,
-            # Stressed case
-            'stressed_V': stressed_result['V'],
-            'stressed_sigma_V': stressed_result['sigma_V'],
-            'stressed_DD': stressed_DD,
-            'stressed_PD': stressed_PD,
-            # Changes
-            'DD_change': DD_change,
-            'PD_change': PD_change,
-            'PD_change_pct': (PD_change / base_PD * 100) if base_PD > 0 else np.nan,
-            # Convergence
-            'base_converged': base_result['converged'],
-            'stressed_converged': stressed_result['converged']
-        }
+        return _scenario_row(
+            scenario,
+            base_result['V'], base_result['sigma_V'], base_DD, base_PD, base_result['converged'],
+            stressed_result['V'], stressed_result['sigma_V'], stressed_DD, stressed_PD,
+            stressed_result['converged']
+        )
 
     def test_all_scenarios(
             self,
@@ -241,23 +324,80 @@ class StressTester:
         Returns:
             DataFrame with results for all scenarios
         """
-        if scenarios is None:
-            scenarios = list(self.HISTORICAL_SCENARIOS.keys())
+        selected = self.select_scenarios(scenarios)
 
-        results = []
+        if not selected:
+            return pd.DataFrame()
 
-        for scenario_name in scenarios:
-            if scenario_name not in self.HISTORICAL_SCENARIOS:
-                print(f"Warning: Unknown scenario '{scenario_name}', skipping")
-                continue
+        # Base case in row 0, one stressed case per scenario after it, all
+        # solved in one vectorized pass
+        stressed = apply_shocks(scenario_shocks(selected), base_params)
+        params = {
+            key: np.concatenate(([base_params[key]], values)).astype(float)
+            for key, values in stressed.items()
+        }
+        solved = self.solver.solve_batch(
+            params['E'], params['sigma_E'], params['D'], params['r'], params['T']
+        )
 
-            scenario = self.HISTORICAL_SCENARIOS[scenario_name]
-            result = self.test_scenario(scenario, base_params)
-            results.append(result)
+        # NaN V/σ_V for non-converged cases carries through to NaN DD/PD
+        V, sigma_V, converged = solved['V'], solved['sigma_V'], solved['converged']
+        DD = calculate_dd_risk_neutral(V, params['D'], sigma_V, params['r'], params['T'])
+        PD = calculate_pd_from_dd(DD)
+
+        results = [
+            _scenario_row(
+                scenario,
+                V[0], sigma_V[0], DD[0], PD[0], bool(converged[0]),
+                V[k], sigma_V[k], DD[k], PD[k], bool(converged[k])
+            )
+            for k, scenario in enumerate(selected, start=1)
+        ]
 
         return pd.DataFrame(results)
 
 
+def _scenario_row(
+        scenario: StressScenario,
+        base_V: float,
+        base_sigma_V: float,
+        base_DD: float,
+        base_PD: float,
+        base_converged: bool,
+        stressed_V: float,
+        stressed_sigma_V: float,
+        stressed_DD: float,
+        stressed_PD: float,
+        stressed_converged: bool
+) -> Dict:
+    """Assemble one scenario's result record from base and stressed solutions."""
+    # Calculate changes
+    DD_change = stressed_DD - base_DD if not np.isnan(stressed_DD) else np.nan
+    PD_change = stressed_PD - base_PD if not np.isnan(stressed_PD) else np.nan
+
+    return {
+        'scenario_name': scenario.name,
+        'scenario_description': scenario.description,
+        # Base case
+        'base_V': base_V,
+        'base_sigma_V': base_sigma_V,
+        'base_DD': base_DD,
+        'base_PD': base_PD,
+        # Stressed case
+        'stressed_V': stressed_V,
+        'stressed_sigma_V': stressed_sigma_V,
+        'stressed_DD': stressed_DD,
+        'stressed_PD': stressed_PD,
+        # Changes
+        'DD_change': DD_change,
+        'PD_change': PD_change,
+        'PD_change_pct': (PD_change / base_PD * 100) if base_PD > 0 else np.nan,
+        # Convergence
+        'base_converged': base_converged,
+        'stressed_converged': stressed_converged
+    }
+
+
 def run_stress_test(
         ticker: str,
         engine,
@@ -276,10 +416,10 @@ def run_stress_test(
     Returns:
         DataFrame with stress test results
     """
-    from features.merton_inputs import build_merton_inputs
+    from features.merton_inputs import build_merton_inputs_cached
 
     # Load Merton inputs
-    inputs = build_merton_inputs(ticker, engine)
+    inputs = build_merton_inputs_cached(ticker, engine)
 
     if inputs.empty:
         raise ValueError(f"No Merton inputs found for {ticker}")
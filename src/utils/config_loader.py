@@ -4,7 +4,7 @@ Configuration loader for YAML config files.
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 # YAML import with error handling
 try:
@@ -19,6 +19,10 @@ except ImportError:
     )
 
 
+# Marks a dotted key that isn't present (distinct from a stored None)
+_MISSING = object()
+
+
 class ConfigLoader:
     """Load and manage configuration from YAML files."""
 
@@ -31,6 +35,8 @@ class ConfigLoader:
         """
         self.config_dir = Path(config_dir)
         self._configs = {}
+        # Resolved dotted-key lookups: (config_name, key) -> value or _MISSING
+        self._resolved: Dict[Tuple[str, str], Any] = {}
 
     def load(self, config_name: str) -> Dict[str, Any]:
         """
@@ -78,17 +84,25 @@ class ConfigLoader:
         Returns:
             Configuration value or default
         """
-        config = self.load(config_name)
+        cache_key = (config_name, key)
+        try:
+            value = self._resolved[cache_key]
+        except KeyError:
+            value = self._resolve(self.load(config_name), key)
+            self._resolved[cache_key] = value
 
-        # Support dot notation for nested keys
-        keys = key.split('.')
+        return default if value is _MISSING else value
+
+    @staticmethod
+    def _resolve(config: Dict[str, Any], key: str) -> Any:
+        """Walk a dotted key through nested dicts (_MISSING if absent)."""
         value = config
 
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
 
         return value
 
@@ -145,11 +159,16 @@ class ConfigLoader:
             config_name: Specific config to reload, or None to reload all
         """
         if config_name:
+            self._resolved = {
+                cache_key: value for cache_key, value in self._resolved.items()
+                if cache_key[0] != config_name
+            }
             if config_name in self._configs:
                 del self._configs[config_name]
                 self.load(config_name)
         else:
             self._configs.clear()
+            self._resolved.clear()
 
 
 # Global config loader instance
@@ -3,8 +3,12 @@
 Centralized logging configuration for Merton PD engine.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -12,7 +16,8 @@ from datetime import datetime
 def setup_logger(
         name: str = "merton",
         level: int = logging.INFO,
-        log_file: str = None
+        log_file: str = None,
+        use_queue: bool = False
 ) -> logging.Logger:
     """
     Setup logger with console and optional file output.
@@ -21,6 +26,8 @@ def setup_logger(
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
+        use_queue: Hand records to a background QueueListener so console
+                   and file I/O don't block the caller
 
     Returns:
         Configured logger
@@ -32,6 +39,8 @@ def setup_logger(
     if logger.handlers:
         return logger
 
+    handlers = []
+
     # Console handler with formatting
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
@@ -42,7 +51,7 @@ def setup_logger(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # Optional file handler
     if log_file:
@@ -52,7 +61,22 @@ def setup_logger(
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if use_queue:
+        # Records are formatted and written on the listener thread
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.propagate = False
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     return logger
 
@@ -61,10 +85,14 @@ def setup_logger(
 default_logger = setup_logger()
 
 
+@lru_cache(maxsize=64)
 def get_logger(name: str = None) -> logging.Logger:
     """
     Get logger instance.
 
+    Memoized: logging.getLogger already returns the same object per name,
+    so caching only skips the name formatting and the registry lookup.
+
     Args:
         name: Logger name (will be prefixed with 'merton.')
 
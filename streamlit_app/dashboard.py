@@ -14,19 +14,33 @@ Features:
     - Stress test scenarios
 """
 
+import io
+import os
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
-from src.db.engine import ENGINE
+from scipy.special import ndtr
+from sqlalchemy import text
+from src.db.engine import get_engine
+from src.db.signals import SIGNAL_LOOKBACK_DAYS
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Optional Redis shared by all dashboard workers (e.g. redis://localhost:6379/0);
+# without it each Streamlit process keeps only its own st.cache_data copy
+REDIS_URL = os.getenv("MERTON_REDIS_URL")
 
 # ============================================================
 # PAGE CONFIG
@@ -43,85 +57,275 @@ st.set_page_config(
 # HELPER FUNCTIONS
 # ============================================================
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def get_available_tickers():
-    """Get list of all tickers in the database."""
+@st.cache_resource
+def get_db_engine():
+    """Pooled SQLAlchemy engine, shared by every session and rerun."""
+    return get_engine()
+
+
+@st.cache_data(ttl=10)
+def get_data_watermark():
+    """Latest write time behind the merton_latest view (a one-row probe)."""
+    query = "SELECT MAX(created_at) FROM merton_latest"
+    return pd.read_sql(query, get_db_engine()).iloc[0, 0]
+
+
+@st.cache_resource
+def get_shared_cache():
+    """Redis client for cross-worker caching, or None if not configured."""
+    if redis is None or not REDIS_URL:
+        return None
+    return redis.Redis.from_url(REDIS_URL, socket_timeout=0.5)
+
+
+def read_shared_frame(key: str):
+    """Get a DataFrame from the shared cache (None on miss or Redis error)."""
+    cache = get_shared_cache()
+    if cache is None:
+        return None
+    try:
+        payload = cache.get(key)
+    except redis.RedisError:
+        return None
+    return None if payload is None else pd.read_parquet(io.BytesIO(payload))
+
+
+def write_shared_frame(key: str, df: pd.DataFrame, ttl: int = 3600):
+    """Put a DataFrame in the shared cache as Parquet; errors are ignored."""
+    cache = get_shared_cache()
+    if cache is None:
+        return
+    try:
+        cache.setex(key, ttl, df.to_parquet())
+    except redis.RedisError:
+        pass
+
+
+@st.cache_data(ttl=3600)
+def load_dashboard_data(watermark):
+    """
+    Latest output row per ticker, shared by every page.
+
+    One query replaces the separate ticker list and latest-row lookups:
+    the ticker list is the overview's ticker column.
+
+    Args:
+        watermark: get_data_watermark() value; only part of the cache key,
+            so the query reruns when outputs are written or rewritten
+            rather than on a short TTL
+    """
+    # merton_latest (src/db/schema.sql) holds one row per ticker, refreshed
+    # by the pipeline. Rating bands match dd_to_rating; both derived columns
+    # are computed during the scan rather than in pandas afterwards
     query = """
-        SELECT DISTINCT ticker
-        FROM merton_outputs
+        SELECT
+            *,
+            CASE
+                WHEN distance_to_default > 10 THEN 'AAA'
+                WHEN distance_to_default > 8 THEN 'AA'
+                WHEN distance_to_default > 6 THEN 'A'
+                WHEN distance_to_default > 4 THEN 'BBB'
+                WHEN distance_to_default > 2 THEN 'BB'
+                ELSE 'B/CCC'
+            END AS rating,
+            probability_default * 10000 AS pd_bps
+        FROM merton_latest
         ORDER BY ticker
     """
-    df = pd.read_sql(query, ENGINE)
-    return df['ticker'].tolist()
+    # Another worker may already have read this watermark's overview
+    cache_key = f"merton:overview:{watermark}"
+    overview_df = read_shared_frame(cache_key)
+    if overview_df is None:
+        overview_df = pd.read_sql(query, get_db_engine())
+        write_shared_frame(cache_key, overview_df)
+
+    return {
+        'tickers': overview_df['ticker'].tolist(),
+        'last_update': watermark,
+        'overview_df': overview_df
+    }
+
+
+def get_dashboard_data():
+    """Dashboard data for the current watermark (see load_dashboard_data)."""
+    return load_dashboard_data(get_data_watermark())
+
+
+def get_available_tickers():
+    """Get list of all tickers in the database."""
+    return get_dashboard_data()['tickers']
 
 
-@st.cache_data(ttl=60)
 def get_latest_pd(ticker: str):
     """Get latest PD/DD for a ticker."""
-    query = f"""
-        SELECT *
-        FROM merton_outputs
-        WHERE ticker = '{ticker}'
-        ORDER BY date DESC
-        LIMIT 1
-    """
-    df = pd.read_sql(query, ENGINE)
-    return df.iloc[0] if not df.empty else None
+    overview_df = get_dashboard_data()['overview_df']
+    latest = overview_df[overview_df['ticker'] == ticker]
+    return latest.iloc[0] if not latest.empty else None
 
 
 @st.cache_data(ttl=60)
 def get_pd_history(ticker: str, days: int = 180):
     """Get historical PD/DD data."""
-    cutoff_date = (datetime.now() - timedelta(days=days)).date()
-    query = f"""
+    query = text("""
         SELECT 
             date,
             distance_to_default,
-            probability_default,
+            probability_default * 10000 AS pd_bps,
             asset_volatility,
             leverage_ratio
         FROM merton_outputs
-        WHERE ticker = '{ticker}'
-        AND date >= '{cutoff_date}'
+        WHERE ticker = :ticker
+        AND date >= CURRENT_DATE - :days * INTERVAL '1 day'
         ORDER BY date
-    """
-    return pd.read_sql(query, ENGINE)
+    """)
+    # Arrow-backed columns: history is the bulk of the dashboard's result
+    # rows and is only aggregated and plotted
+    return pd.read_sql_query(
+        query, get_db_engine(), params={"ticker": ticker, "days": days},
+        dtype_backend="pyarrow"
+    )
+
+
+@st.cache_data(ttl=60)
+def get_portfolio_history(tickers: list):
+    """Get 90-day DD history for several tickers (bound as one array param)."""
+    query = text("""
+        SELECT 
+            ticker,
+            date,
+            distance_to_default
+        FROM merton_outputs
+        WHERE ticker = ANY(:tickers)
+        AND date >= CURRENT_DATE - INTERVAL '90 days'
+        ORDER BY date
+    """)
+    return pd.read_sql_query(
+        query, get_db_engine(), params={"tickers": tickers},
+        dtype_backend="pyarrow"
+    )
 
 
 @st.cache_data(ttl=60)
 def get_trading_signals(lookback_days: int = 30, min_dd_change: float = 1.0):
-    """Get CDS trading signals."""
-    query = f"""
-        WITH current_dd AS (
-            SELECT DISTINCT ON (ticker)
-                ticker,
-                date as current_date,
-                distance_to_default as current_dd,
-                probability_default as current_pd
-            FROM merton_outputs
-            ORDER BY ticker, date DESC
-        ),
-        historical_dd AS (
-            SELECT DISTINCT ON (ticker)
-                ticker,
-                date as historical_date,
-                distance_to_default as historical_dd
-            FROM merton_outputs
-            WHERE date <= CURRENT_DATE - INTERVAL '{lookback_days} days'
-            ORDER BY ticker, date DESC
-        )
+    """
+    Get CDS trading signals.
+
+    Reads the precomputed merton_signals table (src/db/signals.py), so
+    lookback_days must be one of SIGNAL_LOOKBACK_DAYS.
+    """
+    query = text("""
         SELECT 
-            c.ticker,
-            c.current_dd,
-            h.historical_dd,
-            (c.current_dd - h.historical_dd) as dd_change
-        FROM current_dd c
-        LEFT JOIN historical_dd h ON c.ticker = h.ticker
-        WHERE h.historical_dd IS NOT NULL
-        AND ABS(c.current_dd - h.historical_dd) >= {min_dd_change}
-        ORDER BY ABS(c.current_dd - h.historical_dd) DESC
+            ticker,
+            current_dd,
+            historical_dd,
+            dd_change
+        FROM merton_signals
+        WHERE lookback_days = :lookback_days
+        AND ABS(dd_change) >= :min_dd_change
+        ORDER BY ABS(dd_change) DESC
+    """)
+    return pd.read_sql_query(
+        query, get_db_engine(),
+        params={"lookback_days": lookback_days, "min_dd_change": min_dd_change}
+    )
+
+
+@st.cache_data(ttl=60)
+def get_history_stats(ticker: str, days: int):
     """
-    return pd.read_sql(query, ENGINE)
+    Summary statistics of a ticker's PD/DD history.
+
+    Works on the history columns as float ndarrays (NaN for missing
+    values, skipped like pandas' reductions) and is cached on the same
+    (ticker, days) key as the history.
+    """
+    hist_df = get_pd_history(ticker, days)
+    dd, pd_bps, vol, lev = (
+        hist_df[col].to_numpy(dtype=float, na_value=np.nan)
+        for col in ('distance_to_default', 'pd_bps',
+                    'asset_volatility', 'leverage_ratio')
+    )
+    
+    return {
+        'dd_mean': np.nanmean(dd),
+        'dd_min': np.nanmin(dd),
+        'dd_max': np.nanmax(dd),
+        'dd_std': np.nanstd(dd, ddof=1),
+        'pd_bps_mean': np.nanmean(pd_bps),
+        'vol_mean': np.nanmean(vol),
+        'lev_mean': np.nanmean(lev)
+    }
+
+
+# Rating thresholds drawn on the DD trend chart: (DD, line colour, label)
+RATING_LINES = (
+    (10, "green", "AAA"),
+    (8, "lightgreen", "AA"),
+    (6, "yellow", "A"),
+    (4, "orange", "BBB"),
+    (2, "red", "BB"),
+)
+
+# Stress Testing scenarios, index-aligned: names, volatility multipliers
+# and asset value shocks
+STRESS_SCENARIOS = (
+    "Mild Recession",
+    "Severe Recession (GFC-like)",
+    "Market Crash (COVID-like)",
+    "Stagflation",
+)
+STRESS_VOLATILITY_MULT = np.array([1.3, 1.8, 2.0, 1.4])
+STRESS_ASSET_SHOCK = np.array([-0.10, -0.35, -0.25, -0.15])
+
+
+@st.cache_data(ttl=60)
+def build_history_figures(ticker: str, days: int):
+    """
+    DD and PD trend figures for a ticker.
+
+    Cached on (ticker, days) like the history itself, so reruns reuse the
+    built figures instead of re-adding traces and threshold lines.
+    """
+    hist_df = get_pd_history(ticker, days)
+    
+    dd_fig = go.Figure()
+    dd_fig.add_trace(go.Scatter(
+        x=hist_df['date'],
+        y=hist_df['distance_to_default'],
+        mode='lines',
+        name='DD',
+        line=dict(color='#1f77b4', width=2)
+    ))
+    
+    # Add rating thresholds
+    for level, color, label in RATING_LINES:
+        dd_fig.add_hline(y=level, line_dash="dash", line_color=color, annotation_text=label)
+    
+    dd_fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="Distance to Default (σ)",
+        hovermode='x unified',
+        height=400
+    )
+    
+    pd_fig = go.Figure()
+    pd_fig.add_trace(go.Scatter(
+        x=hist_df['date'],
+        y=hist_df['pd_bps'],
+        mode='lines',
+        name='PD',
+        line=dict(color='#ff7f0e', width=2),
+        fill='tozeroy'
+    ))
+    
+    pd_fig.update_layout(
+        xaxis_title="Date",
+        yaxis_title="PD (basis points)",
+        hovermode='x unified',
+        height=400
+    )
+    
+    return dd_fig, pd_fig
 
 
 def dd_to_rating(dd: float) -> str:
@@ -140,9 +344,14 @@ def dd_to_rating(dd: float) -> str:
         return "B/CCC"
 
 
-def pd_to_bps(pd_value: float) -> float:
-    """Convert PD to basis points."""
-    return pd_value * 10000
+def dd_to_ratings(dd) -> np.ndarray:
+    """Convert an array of DDs to credit ratings (vectorized dd_to_rating)."""
+    dd = np.asarray(dd, dtype=float)
+    return np.select(
+        [dd > 10, dd > 8, dd > 6, dd > 4, dd > 2],
+        ["AAA", "AA", "A", "BBB", "BB"],
+        default="B/CCC"
+    )
 
 
 # ============================================================
@@ -178,7 +387,8 @@ if page == "🏠 Home":
     st.markdown("### Real-time Credit Analysis for Your Portfolio")
     
     # Get summary statistics
-    tickers = get_available_tickers()
+    dashboard_data = get_dashboard_data()
+    tickers = dashboard_data['tickers']
     
     col1, col2, col3 = st.columns(3)
     
@@ -187,8 +397,7 @@ if page == "🏠 Home":
     
     with col2:
         # Get latest update time
-        query = "SELECT MAX(created_at) FROM merton_outputs"
-        last_update = pd.read_sql(query, ENGINE).iloc[0, 0]
+        last_update = dashboard_data['last_update']
         st.metric("Last Updated", last_update.strftime("%Y-%m-%d %H:%M"))
     
     with col3:
@@ -201,36 +410,22 @@ if page == "🏠 Home":
     # Show overview table
     st.subheader("Portfolio Overview")
     
-    query = """
-        WITH latest AS (
-            SELECT DISTINCT ON (ticker)
-                ticker,
-                distance_to_default,
-                probability_default,
-                leverage_ratio,
-                date
-            FROM merton_outputs
-            ORDER BY ticker, date DESC
-        )
-        SELECT * FROM latest ORDER BY ticker
-    """
-    df = pd.read_sql(query, ENGINE)
-    
-    # Add rating column
-    df['rating'] = df['distance_to_default'].apply(dd_to_rating)
-    df['pd_bps'] = df['probability_default'].apply(pd_to_bps)
+    df = dashboard_data['overview_df']
     
     # Format display
     display_df = df[['ticker', 'rating', 'distance_to_default', 'pd_bps', 'leverage_ratio', 'date']].copy()
     display_df.columns = ['Ticker', 'Rating', 'DD', 'PD (bps)', 'Leverage', 'Date']
+    display_df['Leverage'] *= 100  # printf formats have no percent scaling
     
+    # Raw numbers go to the frontend, which applies the formats itself
     st.dataframe(
-        display_df.style.format({
-            'DD': '{:.2f}',
-            'PD (bps)': '{:.4f}',
-            'Leverage': '{:.2%}'
-        }),
-        use_container_width=True
+        display_df,
+        use_container_width=True,
+        column_config={
+            'DD': st.column_config.NumberColumn(format='%.2f'),
+            'PD (bps)': st.column_config.NumberColumn(format='%.4f'),
+            'Leverage': st.column_config.NumberColumn(format='%.2f%%')
+        }
     )
 
 # ============================================================
@@ -269,8 +464,7 @@ elif page == "🔍 Company Analysis":
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                rating = dd_to_rating(latest['distance_to_default'])
-                st.metric("Credit Rating", rating)
+                st.metric("Credit Rating", latest['rating'])
             
             with col2:
                 st.metric(
@@ -279,7 +473,7 @@ elif page == "🔍 Company Analysis":
                 )
             
             with col3:
-                pd_bps = pd_to_bps(latest['probability_default'])
+                pd_bps = latest['pd_bps']
                 st.metric("PD (basis points)", f"{pd_bps:.4f}")
             
             with col4:
@@ -294,77 +488,38 @@ elif page == "🔍 Company Analysis":
             hist_df = get_pd_history(selected_ticker, lookback)
             
             if not hist_df.empty:
+                dd_fig, pd_fig = build_history_figures(selected_ticker, lookback)
+                
                 # Plot DD over time
                 st.subheader("Distance to Default Trend")
-                
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=hist_df['date'],
-                    y=hist_df['distance_to_default'],
-                    mode='lines',
-                    name='DD',
-                    line=dict(color='#1f77b4', width=2)
-                ))
-                
-                # Add rating thresholds
-                fig.add_hline(y=10, line_dash="dash", line_color="green", annotation_text="AAA")
-                fig.add_hline(y=8, line_dash="dash", line_color="lightgreen", annotation_text="AA")
-                fig.add_hline(y=6, line_dash="dash", line_color="yellow", annotation_text="A")
-                fig.add_hline(y=4, line_dash="dash", line_color="orange", annotation_text="BBB")
-                fig.add_hline(y=2, line_dash="dash", line_color="red", annotation_text="BB")
-                
-                fig.update_layout(
-                    xaxis_title="Date",
-                    yaxis_title="Distance to Default (σ)",
-                    hovermode='x unified',
-                    height=400
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(dd_fig, use_container_width=True)
                 
                 # Plot PD over time
                 st.subheader("Probability of Default Trend")
-                
-                fig2 = go.Figure()
-                fig2.add_trace(go.Scatter(
-                    x=hist_df['date'],
-                    y=hist_df['probability_default'] * 10000,  # Convert to bps
-                    mode='lines',
-                    name='PD',
-                    line=dict(color='#ff7f0e', width=2),
-                    fill='tozeroy'
-                ))
-                
-                fig2.update_layout(
-                    xaxis_title="Date",
-                    yaxis_title="PD (basis points)",
-                    hovermode='x unified',
-                    height=400
-                )
-                
-                st.plotly_chart(fig2, use_container_width=True)
+                st.plotly_chart(pd_fig, use_container_width=True)
                 
                 # Statistics
                 st.subheader("Summary Statistics")
                 col1, col2 = st.columns(2)
                 
+                stats = get_history_stats(selected_ticker, lookback)
+                
                 with col1:
                     st.markdown(f"""
                     **Distance to Default:**
-                    - Average: {hist_df['distance_to_default'].mean():.2f}σ
-                    - Min: {hist_df['distance_to_default'].min():.2f}σ
-                    - Max: {hist_df['distance_to_default'].max():.2f}σ
-                    - Std Dev: {hist_df['distance_to_default'].std():.2f}σ
+                    - Average: {stats['dd_mean']:.2f}σ
+                    - Min: {stats['dd_min']:.2f}σ
+                    - Max: {stats['dd_max']:.2f}σ
+                    - Std Dev: {stats['dd_std']:.2f}σ
                     """)
                 
                 with col2:
-                    avg_pd_bps = hist_df['probability_default'].mean() * 10000
                     st.markdown(f"""
                     **Probability of Default:**
-                    - Average: {avg_pd_bps:.4f} bps
+                    - Average: {stats['pd_bps_mean']:.4f} bps
                     - Current: {pd_bps:.4f} bps
-                    - Volatility: {hist_df['asset_volatility'].mean():.2%}
-                    - Leverage: {hist_df['leverage_ratio'].mean():.2%}
+                    - Volatility: {stats['vol_mean']:.2%}
+                    - Leverage: {stats['lev_mean']:.2%}
                     """)
 
 # ============================================================
@@ -384,23 +539,10 @@ elif page == "📈 Portfolio View":
     )
     
     if selected_tickers:
-        # Get latest data for all selected tickers
-        tickers_str = "','".join(selected_tickers)
-        query = f"""
-            WITH latest AS (
-                SELECT DISTINCT ON (ticker)
-                    ticker,
-                    date,
-                    distance_to_default,
-                    probability_default,
-                    leverage_ratio
-                FROM merton_outputs
-                WHERE ticker IN ('{tickers_str}')
-                ORDER BY ticker, date DESC
-            )
-            SELECT * FROM latest
-        """
-        df = pd.read_sql(query, ENGINE)
+        # Latest data for the selected tickers comes from the shared overview;
+        # only the history below needs its own query
+        overview_df = get_dashboard_data()['overview_df']
+        df = overview_df[overview_df['ticker'].isin(selected_tickers)]
         
         # Bar chart comparison
         st.subheader("Distance to Default Comparison")
@@ -420,18 +562,7 @@ elif page == "📈 Portfolio View":
         st.subheader("DD Trend Comparison (90 days)")
         
         # Get historical data
-        cutoff_date = (datetime.now() - timedelta(days=90)).date()
-        query = f"""
-            SELECT 
-                ticker,
-                date,
-                distance_to_default
-            FROM merton_outputs
-            WHERE ticker IN ('{tickers_str}')
-            AND date >= '{cutoff_date}'
-            ORDER BY date
-        """
-        hist_df = pd.read_sql(query, ENGINE)
+        hist_df = get_portfolio_history(sorted(selected_tickers))
         
         fig = px.line(
             hist_df,
@@ -453,7 +584,9 @@ elif page == "⚡ Trading Signals":
     
     col1, col2 = st.columns(2)
     with col1:
-        lookback = st.slider("Lookback Period (days)", 7, 90, 30)
+        lookback = st.select_slider(
+            "Lookback Period (days)", options=SIGNAL_LOOKBACK_DAYS, value=30
+        )
     with col2:
         min_change = st.slider("Minimum DD Change (σ)", 0.5, 3.0, 1.0, 0.1)
     
@@ -461,49 +594,47 @@ elif page == "⚡ Trading Signals":
     
     if not signals.empty:
         # Add signal classification
-        signals['action'] = signals['dd_change'].apply(
-            lambda x: 'LONG PROTECTION' if x < 0 else 'SHORT PROTECTION'
-        )
-        signals['strength'] = signals['dd_change'].abs().apply(
-            lambda x: min(x / 5.0, 1.0)
+        signals['action'] = np.where(
+            signals['dd_change'] < 0, 'LONG PROTECTION', 'SHORT PROTECTION'
         )
+        signals['strength'] = np.minimum(signals['dd_change'].abs() / 5.0, 1.0)
         
         st.subheader(f"Found {len(signals)} Trading Signals")
         
-        # Display signals
-        for _, signal in signals.iterrows():
-            action = signal['action']
-            color = "🔴" if action == 'LONG PROTECTION' else "🟢"
+        # Display all signals as one table
+        display_df = signals[['ticker', 'action', 'current_dd', 'historical_dd', 'dd_change', 'strength']].copy()
+        display_df.columns = ['Ticker', 'Action', 'Current DD', 'Historical DD', 'DD Change', 'Strength']
+        
+        st.dataframe(
+            display_df.style
+            .background_gradient(subset=['DD Change'], cmap='RdYlGn')
+            .format({
+                'Current DD': '{:.2f}σ',
+                'Historical DD': '{:.2f}σ',
+                'DD Change': '{:.2f}σ',
+                'Strength': '{:.0%}'
+            }),
+            use_container_width=True
+        )
+        
+        # Recommendation for one selected signal
+        selected = st.selectbox("Signal Details", options=signals['ticker'].tolist())
+        signal = signals.loc[signals['ticker'] == selected].iloc[0]
+        
+        if signal['action'] == 'LONG PROTECTION':
+            st.warning(f"""
+            **Recommendation:** Consider buying credit protection (CDS)
             
-            with st.expander(f"{color} {signal['ticker']} - {action}"):
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.metric("Current DD", f"{signal['current_dd']:.2f}σ")
-                with col2:
-                    st.metric(
-                        "DD Change",
-                        f"{signal['dd_change']:.2f}σ",
-                        delta=f"{signal['dd_change']:.2f}σ"
-                    )
-                with col3:
-                    strength_pct = signal['strength'] * 100
-                    st.metric("Signal Strength", f"{strength_pct:.0f}%")
-                
-                if action == 'LONG PROTECTION':
-                    st.warning(f"""
-                    **Recommendation:** Consider buying credit protection (CDS)
-                    
-                    **Rationale:** Distance to default has declined from {signal['historical_dd']:.2f}σ to {signal['current_dd']:.2f}σ 
-                    over the past {lookback} days, indicating deteriorating credit quality.
-                    """)
-                else:
-                    st.success(f"""
-                    **Recommendation:** Consider selling credit protection (CDS)
-                    
-                    **Rationale:** Distance to default has increased from {signal['historical_dd']:.2f}σ to {signal['current_dd']:.2f}σ 
-                    over the past {lookback} days, indicating improving credit quality.
-                    """)
+            **Rationale:** Distance to default has declined from {signal['historical_dd']:.2f}σ to {signal['current_dd']:.2f}σ 
+            over the past {lookback} days, indicating deteriorating credit quality.
+            """)
+        else:
+            st.success(f"""
+            **Recommendation:** Consider selling credit protection (CDS)
+            
+            **Rationale:** Distance to default has increased from {signal['historical_dd']:.2f}σ to {signal['current_dd']:.2f}σ 
+            over the past {lookback} days, indicating improving credit quality.
+            """)
     else:
         st.info("No significant DD changes detected in the current period.")
 
@@ -527,66 +658,39 @@ elif page == "🧪 Stress Testing":
             with col1:
                 st.metric("DD", f"{latest['distance_to_default']:.2f}σ")
             with col2:
-                pd_bps = pd_to_bps(latest['probability_default'])
+                pd_bps = latest['pd_bps']
                 st.metric("PD", f"{pd_bps:.4f} bps")
             with col3:
-                st.metric("Rating", dd_to_rating(latest['distance_to_default']))
+                st.metric("Rating", latest['rating'])
             
             st.markdown("---")
             st.subheader("Scenario Analysis")
             
-            # Define scenarios
-            scenarios = {
-                "Mild Recession": {
-                    "volatility_mult": 1.3,
-                    "asset_shock": -0.10
-                },
-                "Severe Recession (GFC-like)": {
-                    "volatility_mult": 1.8,
-                    "asset_shock": -0.35
-                },
-                "Market Crash (COVID-like)": {
-                    "volatility_mult": 2.0,
-                    "asset_shock": -0.25
-                },
-                "Stagflation": {
-                    "volatility_mult": 1.4,
-                    "asset_shock": -0.15
-                }
-            }
+            # Simulate all scenarios at once (simplified stress calculation)
+            stressed_vol = latest['asset_volatility'] * STRESS_VOLATILITY_MULT
+            stressed_asset = latest['asset_value'] * (1 + STRESS_ASSET_SHOCK)
             
-            # Simulate scenarios
-            results = []
-            for scenario_name, params in scenarios.items():
-                # Simplified stress calculation
-                stressed_vol = latest['asset_volatility'] * params['volatility_mult']
-                stressed_asset = latest['asset_value'] * (1 + params['asset_shock'])
-                
-                # Approximate stressed DD
-                import numpy as np
-                from scipy.stats import norm
-                
-                D = stressed_asset * latest['leverage_ratio']
-                stressed_dd = (np.log(stressed_asset / D) + 0.04 - 0.5 * stressed_vol**2) / stressed_vol
-                stressed_pd = norm.cdf(-stressed_dd)
-                
-                results.append({
-                    'Scenario': scenario_name,
-                    'DD': stressed_dd,
-                    'PD (bps)': stressed_pd * 10000,
-                    'Rating': dd_to_rating(stressed_dd),
-                    'DD Change': stressed_dd - latest['distance_to_default']
-                })
+            # Approximate stressed DD
+            D = stressed_asset * latest['leverage_ratio']
+            stressed_dd = (np.log(stressed_asset / D) + 0.04 - 0.5 * stressed_vol**2) / stressed_vol
+            stressed_pd = ndtr(-stressed_dd)
             
-            results_df = pd.DataFrame(results)
+            results_df = pd.DataFrame({
+                'Scenario': STRESS_SCENARIOS,
+                'DD': stressed_dd,
+                'PD (bps)': stressed_pd * 10000,
+                'Rating': dd_to_ratings(stressed_dd),
+                'DD Change': stressed_dd - latest['distance_to_default']
+            })
             
             st.dataframe(
-                results_df.style.format({
-                    'DD': '{:.2f}',
-                    'PD (bps)': '{:.2f}',
-                    'DD Change': '{:.2f}'
-                }),
-                use_container_width=True
+                results_df,
+                use_container_width=True,
+                column_config={
+                    'DD': st.column_config.NumberColumn(format='%.2f'),
+                    'PD (bps)': st.column_config.NumberColumn(format='%.2f'),
+                    'DD Change': st.column_config.NumberColumn(format='%.2f')
+                }
             )
             
             # Visualization
@@ -618,6 +722,12 @@ elif page == "🧪 Stress Testing":
 # FOOTER
 # ============================================================
 
+with st.sidebar.expander("Cache"):
+    st.caption(f"Data watermark: {get_data_watermark()}")
+    if st.button("Clear cached data"):
+        st.cache_data.clear()
+        st.rerun()
+
 st.sidebar.markdown("---")
 st.sidebar.markdown("""
 <small>